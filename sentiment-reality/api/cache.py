@@ -0,0 +1,36 @@
+"""Tiny in-process TTL cache for read-only endpoint responses.
+
+The dashboard data only changes when a background job writes to the DB,
+so serving a response computed a few seconds ago is fine. A plain dict
+with expiry timestamps keeps the demo snappy without adding Redis or
+any other infrastructure.
+"""
+import time
+
+# TTL for cached responses (seconds). Short enough that a manual
+# refresh shows up quickly, long enough to absorb chart re-renders.
+DEFAULT_TTL = 30
+
+# Safety cap so the cache can't grow without bound
+MAX_ENTRIES = 256
+
+_cache: dict = {}
+
+
+def get(key) -> object | None:
+    """Return the cached value for key, or None if missing/expired."""
+    entry = _cache.get(key)
+    if entry is None:
+        return None
+    expires_at, value = entry
+    if time.monotonic() > expires_at:
+        _cache.pop(key, None)
+        return None
+    return value
+
+
+def set(key, value, ttl: int = DEFAULT_TTL):
+    """Store value under key for ttl seconds."""
+    if len(_cache) >= MAX_ENTRIES:
+        _cache.clear()
+    _cache[key] = (time.monotonic() + ttl, value)
@@ -1,32 +1,103 @@
 """Database connection helper for Postgres."""
 import psycopg2
+from psycopg2.pool import ThreadedConnectionPool
 from psycopg2.extras import RealDictCursor
 from contextlib import contextmanager
 from config import get_db_config
 
+# Shared connection pool - created lazily on first use.
+# Avoids paying a full TCP + auth handshake on every request.
+_pool: ThreadedConnectionPool | None = None
+
+POOL_MIN_CONN = 1
+POOL_MAX_CONN = 10
+
 def is_configured() -> bool:
     """Check if database is configured."""
     return get_db_config() is not None
 
+def _get_pool() -> ThreadedConnectionPool:
+    """Get (or lazily create) the shared connection pool."""
+    global _pool
+    if _pool is None:
+        config = get_db_config()
+        if not config:
+            raise RuntimeError("DATABASE_URL not configured")
+        _pool = ThreadedConnectionPool(POOL_MIN_CONN, POOL_MAX_CONN, **config)
+    return _pool
+
+def warm_pool():
+    """
+    Create the pool and validate one connection ahead of traffic.
+    Called at app startup so the first request doesn't pay the
+    connect + auth handshake.
+    """
+    if not is_configured():
+        return
+    try:
+        with get_connection() as conn:
+            with conn.cursor() as cur:
+                cur.execute("SELECT 1")
+    except Exception as e:
+        # Don't block startup on a cold/unreachable DB
+        print(f"DB pool warmup failed: {e}")
+
+
+def _checkout(pool: ThreadedConnectionPool):
+    """
+    Check out a connection, pre-pinging it so a stale connection
+    (e.g. dropped by Supabase after idling) is replaced instead of
+    failing the request.
+    """
+    conn = pool.getconn()
+    try:
+        with conn.cursor() as cur:
+            cur.execute("SELECT 1")
+        conn.rollback()
+        return conn
+    except psycopg2.Error:
+        pool.putconn(conn, close=True)
+        return pool.getconn()
+
 @contextmanager
 def get_connection():
-    """Get a database connection. Use as context manager."""
-    config = get_db_config()
-    if not config:
-        raise RuntimeError("DATABASE_URL not configured")
-
-    conn = psycopg2.connect(**config)
+    """Get a pooled database connection. Use as context manager."""
+    pool = _get_pool()
+    conn = _checkout(pool)
     try:
         yield conn
+    except Exception:
+        # Don't return a connection with an open failed transaction
+        conn.rollback()
+        raise
     finally:
-        conn.close()
+        pool.putconn(conn)
 
 def query(sql: str, params: tuple = None) -> list[dict]:
     """Execute a SELECT query and return results as list of dicts."""
     with get_connection() as conn:
         with conn.cursor(cursor_factory=RealDictCursor) as cur:
             cur.execute(sql, params)
-            return [dict(row) for row in cur.fetchall()]
+            rows = [dict(row) for row in cur.fetchall()]
+        conn.commit()
+        return rows
+
+def query_many(statements: list[tuple[str, tuple]]) -> list[list[dict]]:
+    """
+    Execute several SELECT queries on a single pooled connection.
+
+    Takes a list of (sql, params) pairs and returns one result list per
+    query, in order. Saves a pool checkout + commit per query when an
+    endpoint needs multiple reads.
+    """
+    with get_connection() as conn:
+        results = []
+        with conn.cursor(cursor_factory=RealDictCursor) as cur:
+            for sql, params in statements:
+                cur.execute(sql, params)
+                results.append([dict(row) for row in cur.fetchall()])
+        conn.commit()
+        return results
 
 def execute(sql: str, params: tuple = None) -> int:
     """Execute an INSERT/UPDATE/DELETE and return affected row count."""
@@ -1,19 +1,39 @@
 """Sentiment Reality API - FastAPI application."""
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.middleware.gzip import GZipMiddleware
+from fastapi.responses import ORJSONResponse
 
 from routers import health, dashboard, stocks, headlines
 
-app = FastAPI(title="Sentiment Reality API")
+# orjson serializes the large dashboard payloads much faster than stdlib json
+app = FastAPI(title="Sentiment Reality API", default_response_class=ORJSONResponse)
 
-# Allow frontend to connect
+# Allow frontend to connect. Explicit method/header lists let the
+# middleware precompute its allow headers, and max_age lets the browser
+# cache preflight responses instead of sending OPTIONS per request.
 app.add_middleware(
     CORSMiddleware,
     allow_origins=["http://localhost:3000"],
-    allow_methods=["*"],
-    allow_headers=["*"],
+    allow_methods=["GET", "POST"],
+    allow_headers=["Content-Type"],
+    max_age=86400,
 )
 
+# Compress JSON responses over ~1 KB (dashboard payloads shrink a lot);
+# smaller responses aren't worth the compression overhead
+app.add_middleware(GZipMiddleware, minimum_size=1024)
+
+@app.on_event("startup")
+def startup():
+    """Open and validate a DB connection before the first request."""
+    try:
+        from db import warm_pool
+        warm_pool()
+    except Exception:
+        # API still serves mock data when the DB layer can't load
+        pass
+
 # Include routers
 app.include_router(health.router)
 app.include_router(dashboard.router)
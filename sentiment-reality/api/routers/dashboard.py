@@ -1,17 +1,20 @@
 """Dashboard endpoint - reads from DB only."""
+import orjson
 from fastapi import APIRouter, Query
+from fastapi.responses import StreamingResponse
 from datetime import date, timedelta
 from schemas import (
     DashboardData, DashboardDataWithHeadlines, DailyDataPoint, PricePoint, DailySentiment,
     WindowMetric, SentimentSummary, PriceSummary, AlignmentSummary, NewsItem, Coverage,
     MisalignmentDay
 )
+import cache
 
 router = APIRouter()
 
 # Try to import db, fall back to mock data if DB not configured
 try:
-    from db import query, is_configured
+    from db import query_many, is_configured
     DB_AVAILABLE = True
 except Exception:
     DB_AVAILABLE = False
@@ -21,6 +24,130 @@ except Exception:
 # Toggle alignment source: True = alignment_daily, False = metrics_windowed
 USE_DAILY_ALIGNMENT = True
 
+# SQL built once at import time so every request sends byte-identical
+# statements (lets Postgres reuse cached plans for the hot queries)
+# One row per date with price, sentiment and metric columns side by side.
+# The FULL OUTER JOINs keep dates that only have one of the three, which
+# is what the old Python dict-union did.
+SQL_DAILY_JOINED = """
+    WITH p AS (
+        SELECT date, close, adj_close, volume
+        FROM prices_daily
+        WHERE ticker = %s AND date >= %s
+    ),
+    s AS (
+        SELECT date, sentiment_avg, article_count,
+               positive_count, neutral_count, negative_count
+        FROM daily_agg
+        WHERE ticker = %s AND date >= %s
+    ),
+    m AS (
+        SELECT date_end AS date, corr, directional_match, alignment_score,
+               misalignment_days, interpretation
+        FROM metrics_windowed
+        WHERE ticker = %s AND window_days = 7 AND date_end >= %s
+    )
+    SELECT
+        COALESCE(p.date, s.date, m.date) AS date,
+        p.close, p.adj_close, p.volume,
+        s.sentiment_avg, s.article_count,
+        s.positive_count, s.neutral_count, s.negative_count,
+        m.corr, m.directional_match, m.alignment_score,
+        m.misalignment_days, m.interpretation
+    FROM p
+    FULL OUTER JOIN s ON s.date = p.date
+    FULL OUTER JOIN m ON m.date = COALESCE(p.date, s.date)
+    ORDER BY 1 ASC
+"""
+
+SQL_HEADLINES = """
+    SELECT
+        i.id::text,
+        i.title,
+        i.source,
+        i.published_at,
+        s.sentiment_label,
+        s.sentiment_score,
+        s.confidence,
+        i.snippet,
+        i.url
+    FROM items i
+    LEFT JOIN item_scores s ON i.id = s.item_id AND s.model = 'hf_fin_v1'
+    WHERE i.ticker = %s
+    ORDER BY i.published_at DESC
+    LIMIT %s
+"""
+
+# Sentiment and price summary numbers aggregated server-side in one pass
+SQL_SUMMARY = """
+    WITH s AS (
+        SELECT sentiment_avg, positive_count, neutral_count, negative_count,
+               ROW_NUMBER() OVER (ORDER BY date DESC) AS rn
+        FROM daily_agg
+        WHERE ticker = %s AND date >= %s
+    ),
+    p AS (
+        SELECT date, close
+        FROM prices_daily
+        WHERE ticker = %s AND date >= %s
+    )
+    SELECT
+        (SELECT AVG(sentiment_avg) FROM s) AS sentiment_avg_period,
+        (SELECT AVG(sentiment_avg) FROM s WHERE rn <= 3) AS recent_avg,
+        (SELECT AVG(sentiment_avg) FROM s WHERE rn BETWEEN 4 AND 6) AS older_avg,
+        (SELECT COUNT(*) FROM s) AS sentiment_days,
+        (SELECT SUM(positive_count) FROM s) AS total_pos,
+        (SELECT SUM(neutral_count) FROM s) AS total_neu,
+        (SELECT SUM(negative_count) FROM s) AS total_neg,
+        (SELECT close FROM p ORDER BY date DESC LIMIT 1) AS last_close,
+        (SELECT close FROM p ORDER BY date ASC LIMIT 1) AS first_close,
+        (SELECT COUNT(*) FROM p) AS price_days
+"""
+
+# Weighted alignment score and misalignment-day count in one aggregate
+SQL_ALIGNMENT_AGG = """
+    SELECT
+        SUM(alignment_raw * alignment_weight) / NULLIF(SUM(alignment_weight), 0) AS score,
+        COUNT(*) FILTER (WHERE alignment_raw < 0) AS misalignment_days
+    FROM alignment_daily
+    WHERE ticker = %s AND date >= %s
+      AND alignment_raw IS NOT NULL AND alignment_weight IS NOT NULL
+"""
+
+SQL_COVERAGE = """
+    SELECT COUNT(*) as count, MIN(date) as min_date, MAX(date) as max_date
+    FROM daily_agg
+    WHERE ticker = %s AND date >= %s
+"""
+
+SQL_MISALIGNMENT = """
+    SELECT
+        da.date,
+        da.sentiment_avg,
+        da.article_count,
+        pd.return_1d,
+        pd.close
+    FROM daily_agg da
+    LEFT JOIN prices_daily pd ON pd.ticker = da.ticker AND pd.date = da.date
+    WHERE da.ticker = %s AND da.date >= %s
+    ORDER BY da.date DESC
+"""
+
+
+def _respond(data: DashboardDataWithHeadlines, format: str):
+    """Return the dashboard as regular JSON or an NDJSON stream."""
+    if format == "ndjson":
+        return StreamingResponse(_ndjson_stream(data), media_type="application/x-ndjson")
+    return data
+
+
+def _ndjson_stream(data: DashboardDataWithHeadlines):
+    """Yield the dashboard as NDJSON: one summary line, then one line per day."""
+    head = data.model_dump(exclude={"daily_data"})
+    yield orjson.dumps(head) + b"\n"
+    for point in data.daily_data:
+        yield orjson.dumps(point.model_dump()) + b"\n"
+
 
 @router.get("/api/dashboard", response_model=DashboardDataWithHeadlines)
 @router.get("/dashboard", response_model=DashboardDataWithHeadlines, include_in_schema=False)
@@ -28,136 +155,115 @@ def get_dashboard(
     ticker: str = Query("TSLA"),
     period: int = Query(30),
     headlines_limit: int = Query(3, ge=1, le=20),
+    format: str = Query("json", pattern="^(json|ndjson)$"),
 ):
     """
     Get dashboard data for a ticker.
     Reads from DB only: prices_daily, daily_agg, metrics_windowed, items + item_scores.
     Never calls external APIs or ML models.
+
+    format=ndjson streams one summary line plus one line per daily data
+    point, so large periods don't buffer a single giant JSON document.
     """
     ticker = ticker.upper()
 
     if not DB_AVAILABLE or not is_configured():
-        return _mock_dashboard(ticker, period)
+        return _respond(_mock_dashboard(ticker, period), format)
+
+    # Serve recent identical requests from the in-process TTL cache
+    cache_key = ("dashboard", ticker, period, headlines_limit)
+    cached = cache.get(cache_key)
+    if cached is not None:
+        return _respond(cached, format)
 
     try:
         end_date = date.today()
         start_date = end_date - timedelta(days=period)
 
-        # Fetch prices
-        prices = query("""
-            SELECT date, close, adj_close, volume
-            FROM prices_daily
-            WHERE ticker = %s AND date >= %s
-            ORDER BY date ASC
-        """, (ticker, start_date))
-
-        # Fetch daily sentiment aggregates
-        sentiments = query("""
-            SELECT date, sentiment_avg, article_count,
-                   positive_count, neutral_count, negative_count
-            FROM daily_agg
-            WHERE ticker = %s AND date >= %s
-            ORDER BY date ASC
-        """, (ticker, start_date))
-
-        # Fetch windowed metrics (7-day)
-        metrics = query("""
-            SELECT date_end, corr, directional_match, alignment_score,
-                   misalignment_days, interpretation
-            FROM metrics_windowed
-            WHERE ticker = %s AND window_days = 7 AND date_end >= %s
-            ORDER BY date_end ASC
-        """, (ticker, start_date))
-
-        # Fetch recent headlines with scores
-        headlines_raw = query("""
-            SELECT
-                i.id::text,
-                i.title,
-                i.source,
-                i.published_at,
-                s.sentiment_label,
-                s.sentiment_score,
-                s.confidence,
-                i.snippet,
-                i.url
-            FROM items i
-            LEFT JOIN item_scores s ON i.id = s.item_id AND s.model = 'hf_fin_v1'
-            WHERE i.ticker = %s
-            ORDER BY i.published_at DESC
-            LIMIT %s
-        """, (ticker, headlines_limit))
-
-        # Build daily_data by joining on date
-        prices_by_date = {str(p["date"]): p for p in prices}
-        sentiments_by_date = {str(s["date"]): s for s in sentiments}
-        metrics_by_date = {str(m["date_end"]): m for m in metrics}
-
-        all_dates = sorted(set(prices_by_date.keys()) | set(sentiments_by_date.keys()))
-
+        # Every statement the dashboard needs goes out in one pooled
+        # checkout: the joined daily series, headlines, summary
+        # aggregates, alignment aggregate, coverage counts and the
+        # misalignment rows. The date joins happen server-side.
+        (daily_rows, headlines_raw, summary_rows, alignment_rows,
+         coverage_rows, misalignment_rows) = query_many([
+            (SQL_DAILY_JOINED, (ticker, start_date) * 3),
+            (SQL_HEADLINES, (ticker, headlines_limit)),
+            (SQL_SUMMARY, (ticker, start_date) * 2),
+            (SQL_ALIGNMENT_AGG, (ticker, start_date)),
+            (SQL_COVERAGE, (ticker, start_date)),
+            (SQL_MISALIGNMENT, (ticker, start_date)),
+        ])
+        summary_row = summary_rows[0]
+
+        # model_construct skips per-field validation - safe here because the
+        # rows come straight from our own schema
         daily_data = []
-        for d in all_dates:
-            p = prices_by_date.get(d)
-            s = sentiments_by_date.get(d)
-            m = metrics_by_date.get(d)
-
-            daily_data.append(DailyDataPoint(
+        for r in daily_rows:
+            d = str(r["date"])
+            daily_data.append(DailyDataPoint.model_construct(
                 date=d,
-                price=PricePoint(
+                price=PricePoint.model_construct(
                     date=d,
-                    close=p["close"],
-                    adj_close=p.get("adj_close"),
-                    volume=p.get("volume")
-                ) if p else None,
-                sentiment=DailySentiment(
+                    close=r["close"],
+                    adj_close=r.get("adj_close"),
+                    volume=r.get("volume")
+                ) if r["close"] is not None else None,
+                sentiment=DailySentiment.model_construct(
                     date=d,
-                    avg_score=s["sentiment_avg"],
-                    article_count=s["article_count"],
-                    positive_count=s["positive_count"],
-                    neutral_count=s["neutral_count"],
-                    negative_count=s["negative_count"]
-                ) if s else None,
-                metric=WindowMetric(
+                    avg_score=r["sentiment_avg"],
+                    article_count=r["article_count"],
+                    positive_count=r["positive_count"],
+                    neutral_count=r["neutral_count"],
+                    negative_count=r["negative_count"]
+                ) if r["sentiment_avg"] is not None else None,
+                metric=WindowMetric.model_construct(
                     date_end=d,
-                    corr=m.get("corr"),
-                    directional_match=m.get("directional_match"),
-                    alignment_score=m.get("alignment_score"),
-                    misalignment_days=m.get("misalignment_days"),
-                    interpretation=m.get("interpretation")
-                ) if m else None
+                    corr=r.get("corr"),
+                    directional_match=r.get("directional_match"),
+                    alignment_score=r.get("alignment_score"),
+                    misalignment_days=r.get("misalignment_days"),
+                    interpretation=r.get("interpretation")
+                ) if r["alignment_score"] is not None else None
             ))
 
-        # Build headlines list
+        # View over the joined rows for the metrics-based fallback summary
+        metrics = [r for r in daily_rows if r["alignment_score"] is not None]
+
+        # Build headlines list (bind each field once instead of repeated
+        # .get() + indexed lookups per row)
         headlines = []
         for h in headlines_raw:
-            headlines.append(NewsItem(
-                id=h.get("id"),
-                title=h.get("title", "No title"),
-                source=h.get("source"),
-                published_at=str(h["published_at"]) if h.get("published_at") else None,
-                sentiment_label=h.get("sentiment_label"),
-                sentiment_score=float(h["sentiment_score"]) if h.get("sentiment_score") else None,
-                confidence=float(h["confidence"]) if h.get("confidence") else None,
-                snippet=h.get("snippet"),
-                url=h.get("url"),
+            published_at = h["published_at"]
+            sentiment_score = h["sentiment_score"]
+            confidence = h["confidence"]
+            headlines.append(NewsItem.model_construct(
+                id=h["id"],
+                title=h["title"] or "No title",
+                source=h["source"],
+                published_at=str(published_at) if published_at else None,
+                sentiment_label=h["sentiment_label"],
+                sentiment_score=float(sentiment_score) if sentiment_score else None,
+                confidence=float(confidence) if confidence else None,
+                snippet=h["snippet"],
+                url=h["url"],
             ))
 
-        # Compute summaries
-        sentiment_summary = _compute_sentiment_summary(sentiments)
-        price_summary = _compute_price_summary(prices)
+        # Build summaries from the SQL aggregates
+        sentiment_summary = _compute_sentiment_summary(summary_row)
+        price_summary = _compute_price_summary(summary_row)
         if USE_DAILY_ALIGNMENT:
-            alignment_summary = _compute_alignment_from_daily(ticker, start_date)
+            alignment_summary = _compute_alignment_from_daily(alignment_rows)
         else:
             alignment_summary = _compute_alignment_summary(metrics)
 
         # Add misalignment list to alignment summary
-        misalignment_list = _compute_misalignment_list(ticker, start_date)
+        misalignment_list = _compute_misalignment_list(misalignment_rows)
         alignment_summary.misalignment_list = misalignment_list
         alignment_summary.misalignment_days = len(misalignment_list)
 
-        coverage = _compute_coverage(ticker, period)
+        coverage = _compute_coverage(coverage_rows, period)
 
-        return DashboardDataWithHeadlines(
+        response = DashboardDataWithHeadlines(
             ticker=ticker,
             period=period,
             sentiment_summary=sentiment_summary,
@@ -167,27 +273,30 @@ def get_dashboard(
             headlines=headlines,
             coverage=coverage,
         )
+        cache.set(cache_key, response)
+        return _respond(response, format)
 
     except Exception as e:
         # Fall back to mock if DB query fails
         print(f"DB error: {e}")
         import traceback
         traceback.print_exc()
-        return _mock_dashboard(ticker, period)
+        return _respond(_mock_dashboard(ticker, period), format)
 
 
-def _compute_sentiment_summary(sentiments: list) -> SentimentSummary:
-    """Compute sentiment summary from daily aggregates."""
-    if not sentiments:
+def _compute_sentiment_summary(summary_row: dict) -> SentimentSummary:
+    """Build sentiment summary from the SQL_SUMMARY aggregates."""
+    days = summary_row.get("sentiment_days") or 0
+    if days == 0:
         return SentimentSummary()
 
     # Use period average instead of just latest day
-    current_score = sum(s["sentiment_avg"] for s in sentiments) / len(sentiments)
+    current_score = float(summary_row["sentiment_avg_period"])
 
     # Compute trend (compare last 3 days if available)
-    if len(sentiments) >= 3:
-        recent_avg = sum(s["sentiment_avg"] for s in sentiments[-3:]) / 3
-        older_avg = sum(s["sentiment_avg"] for s in sentiments[-6:-3]) / 3 if len(sentiments) >= 6 else current_score
+    if days >= 3:
+        recent_avg = float(summary_row["recent_avg"])
+        older_avg = float(summary_row["older_avg"]) if days >= 6 else current_score
         if recent_avg > older_avg + 0.05:
             trend = "up"
         elif recent_avg < older_avg - 0.05:
@@ -198,9 +307,9 @@ def _compute_sentiment_summary(sentiments: list) -> SentimentSummary:
         trend = "stable"
 
     # Dominant label
-    total_pos = sum(s["positive_count"] for s in sentiments)
-    total_neu = sum(s["neutral_count"] for s in sentiments)
-    total_neg = sum(s["negative_count"] for s in sentiments)
+    total_pos = summary_row.get("total_pos") or 0
+    total_neu = summary_row.get("total_neu") or 0
+    total_neg = summary_row.get("total_neg") or 0
     if total_pos >= total_neu and total_pos >= total_neg:
         dominant = "POSITIVE"
     elif total_neg >= total_pos and total_neg >= total_neu:
@@ -215,14 +324,15 @@ def _compute_sentiment_summary(sentiments: list) -> SentimentSummary:
     )
 
 
-def _compute_price_summary(prices: list) -> PriceSummary:
-    """Compute price summary from daily prices."""
-    if not prices:
+def _compute_price_summary(summary_row: dict) -> PriceSummary:
+    """Build price summary from the SQL_SUMMARY aggregates."""
+    days = summary_row.get("price_days") or 0
+    if days == 0:
         return PriceSummary()
 
-    current_price = prices[-1]["close"]
-    if len(prices) >= 2:
-        first_price = prices[0]["close"]
+    current_price = summary_row["last_close"]
+    if days >= 2:
+        first_price = summary_row["first_close"]
         period_return = round((current_price - first_price) / first_price * 100, 2)
     else:
         period_return = 0.0
@@ -246,40 +356,15 @@ def _compute_alignment_summary(metrics: list) -> AlignmentSummary:
     )
 
 
-def _compute_alignment_from_daily(ticker: str, start_date) -> AlignmentSummary:
-    """Compute alignment summary from alignment_daily table (weighted average)."""
-    rows = query("""
-        SELECT date, alignment_raw, alignment_weight
-        FROM alignment_daily
-        WHERE ticker = %s AND date >= %s
-        ORDER BY date DESC
-    """, (ticker, start_date))
-
-    if not rows:
-        return AlignmentSummary()
-
-    # Weighted average: Σ(raw × weight) / Σ(weight)
-    total_weighted = sum(
-        r["alignment_raw"] * r["alignment_weight"]
-        for r in rows
-        if r["alignment_raw"] is not None and r["alignment_weight"] is not None
-    )
-    total_weight = sum(
-        r["alignment_weight"]
-        for r in rows
-        if r["alignment_weight"] is not None
-    )
-
-    if total_weight == 0:
+def _compute_alignment_from_daily(rows: list[dict]) -> AlignmentSummary:
+    """Build alignment summary from the SQL_ALIGNMENT_AGG rows."""
+    # Weighted average Σ(raw × weight) / Σ(weight) is computed in SQL;
+    # score is NULL when there are no rows or all weights are zero
+    if not rows or rows[0]["score"] is None:
         return AlignmentSummary()
 
-    score = total_weighted / total_weight
-
-    # Count misalignment days (negative alignment_raw)
-    misalignment_days = sum(
-        1 for r in rows
-        if r["alignment_raw"] is not None and r["alignment_raw"] < 0
-    )
+    score = float(rows[0]["score"])
+    misalignment_days = rows[0]["misalignment_days"]
 
     # Interpretation based on score
     if score > 0.3:
@@ -296,17 +381,9 @@ def _compute_alignment_from_daily(ticker: str, start_date) -> AlignmentSummary:
     )
 
 
-def _compute_coverage(ticker: str, period: int) -> Coverage:
-    """Compute sentiment coverage for requested period."""
-    start_date = date.today() - timedelta(days=period)
-
-    result = query("""
-        SELECT COUNT(*) as count, MIN(date) as min_date, MAX(date) as max_date
-        FROM daily_agg
-        WHERE ticker = %s AND date >= %s
-    """, (ticker, start_date))
-
-    row = result[0] if result else {}
+def _compute_coverage(rows: list[dict], period: int) -> Coverage:
+    """Build sentiment coverage for the requested period from SQL_COVERAGE rows."""
+    row = rows[0] if rows else {}
     days_available = row.get("count", 0) or 0
 
     return Coverage(
@@ -318,21 +395,8 @@ def _compute_coverage(ticker: str, period: int) -> Coverage:
     )
 
 
-def _compute_misalignment_list(ticker: str, start_date) -> list[MisalignmentDay]:
+def _compute_misalignment_list(rows: list[dict]) -> list[MisalignmentDay]:
     """Compute misalignment days where sentiment and price disagree."""
-    rows = query("""
-        SELECT
-            da.date,
-            da.sentiment_avg,
-            da.article_count,
-            pd.return_1d,
-            pd.close
-        FROM daily_agg da
-        LEFT JOIN prices_daily pd ON pd.ticker = da.ticker AND pd.date = da.date
-        WHERE da.ticker = %s AND da.date >= %s
-        ORDER BY da.date DESC
-    """, (ticker, start_date))
-
     misalignment_list = []
     for r in rows:
         sentiment = r.get("sentiment_avg")
@@ -377,13 +441,16 @@ def _compute_misalignment_list(ticker: str, start_date) -> list[MisalignmentDay]
     return misalignment_list
 
 
+# Constant seed prices for the mock fallback, built once at import time
+_MOCK_BASE_PRICES = {"SPY": 450, "TSLA": 245, "AAPL": 185, "NVDA": 520, "JPM": 195, "PFE": 28, "GME": 22}
+
+
 def _mock_dashboard(ticker: str, period: int) -> DashboardDataWithHeadlines:
     """Return mock data when DB is not available."""
-    from datetime import date, timedelta
     import random
 
     daily_data = []
-    base_price = {"SPY": 450, "TSLA": 245, "AAPL": 185, "NVDA": 520, "JPM": 195, "PFE": 28, "GME": 22}.get(ticker, 100)
+    base_price = _MOCK_BASE_PRICES.get(ticker, 100)
 
     for i in range(min(period, 14)):
         d = (date.today() - timedelta(days=period-i-1)).isoformat()
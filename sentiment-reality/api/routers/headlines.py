@@ -1,6 +1,7 @@
 """Headlines by date endpoint."""
 from fastapi import APIRouter, Query
 from schemas import NewsItem
+import cache
 
 router = APIRouter()
 
@@ -25,6 +26,11 @@ def get_headlines_by_date(
     if not DB_AVAILABLE or not is_configured():
         return []
 
+    cache_key = ("headlines", ticker, date, limit)
+    cached = cache.get(cache_key)
+    if cached is not None:
+        return cached
+
     rows = query("""
         SELECT
             i.id::text,
@@ -43,14 +49,24 @@ def get_headlines_by_date(
         LIMIT %s
     """, (ticker, date, limit))
 
-    return [NewsItem(
-        id=r.get("id"),
-        title=r.get("title", "No title"),
-        source=r.get("source"),
-        published_at=str(r["published_at"]) if r.get("published_at") else None,
-        sentiment_label=r.get("sentiment_label"),
-        sentiment_score=float(r["sentiment_score"]) if r.get("sentiment_score") else None,
-        confidence=float(r["confidence"]) if r.get("confidence") else None,
-        snippet=r.get("snippet"),
-        url=r.get("url"),
-    ) for r in rows]
+    # model_construct skips validation - rows come from our own schema.
+    # Bind each field once instead of repeated .get() + indexed lookups.
+    items = []
+    for r in rows:
+        published_at = r["published_at"]
+        sentiment_score = r["sentiment_score"]
+        confidence = r["confidence"]
+        items.append(NewsItem.model_construct(
+            id=r["id"],
+            title=r["title"] or "No title",
+            source=r["source"],
+            published_at=str(published_at) if published_at else None,
+            sentiment_label=r["sentiment_label"],
+            sentiment_score=float(sentiment_score) if sentiment_score else None,
+            confidence=float(confidence) if confidence else None,
+            snippet=r["snippet"],
+            url=r["url"],
+        ))
+
+    cache.set(cache_key, items)
+    return items
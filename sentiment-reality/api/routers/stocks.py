@@ -23,11 +23,19 @@ REFRESH_PAYLOAD = {
     "window_days": 7,
 }
 
+# The payload is constant, so serialize it once at import time instead
+# of on every add/refresh request; Postgres casts it to jsonb on insert
+REFRESH_PAYLOAD_JSON = json.dumps(REFRESH_PAYLOAD)
+
+
+# Compiled once at import time; validate_ticker runs on every stock request
+TICKER_RE = re.compile(r'^[A-Z0-9]{1,6}$')
+
 
 def validate_ticker(ticker: str) -> str:
     """Validate and normalize ticker symbol."""
     ticker = ticker.upper().strip()
-    if not re.match(r'^[A-Z0-9]{1,6}$', ticker):
+    if not TICKER_RE.match(ticker):
         raise HTTPException(status_code=400, detail="Ticker must be 1-6 alphanumeric characters")
     return ticker
 
@@ -64,12 +72,15 @@ def add_stock(request: AddStockRequest):
         ON CONFLICT (ticker) DO UPDATE SET is_active = true
     """, (ticker,))
 
-    # Create backfill task with payload
+    # Create backfill task with payload; if one is already pending or
+    # running for this ticker the insert no-ops (task_id stays None)
     result = execute_returning("""
         INSERT INTO tasks (task_type, ticker, priority, status, payload)
         VALUES ('BACKFILL_STOCK', %s, 10, 'PENDING', %s)
+        ON CONFLICT (task_type, ticker) WHERE status IN ('PENDING', 'RUNNING')
+        DO NOTHING
         RETURNING id
-    """, (ticker, json.dumps(REFRESH_PAYLOAD)))
+    """, (ticker, REFRESH_PAYLOAD_JSON))
 
     task_id = str(result["id"]) if result else None
     return TaskResponse(queued=True, task_type="BACKFILL_STOCK", ticker=ticker, task_id=task_id)
@@ -88,12 +99,15 @@ def refresh_stock(request: RefreshStockRequest):
     if not is_configured():
         return TaskResponse(queued=True, task_type="REFRESH_STOCK", ticker=ticker)
 
-    # Create refresh task with payload
+    # Create refresh task with payload; if one is already pending or
+    # running for this ticker the insert no-ops (task_id stays None)
     result = execute_returning("""
         INSERT INTO tasks (task_type, ticker, priority, status, payload)
         VALUES ('REFRESH_STOCK', %s, 50, 'PENDING', %s)
+        ON CONFLICT (task_type, ticker) WHERE status IN ('PENDING', 'RUNNING')
+        DO NOTHING
         RETURNING id
-    """, (ticker, json.dumps(REFRESH_PAYLOAD)))
+    """, (ticker, REFRESH_PAYLOAD_JSON))
 
     task_id = str(result["id"]) if result else None
     return TaskResponse(queued=True, task_type="REFRESH_STOCK", ticker=ticker, task_id=task_id)
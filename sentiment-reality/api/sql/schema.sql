@@ -41,15 +41,75 @@ CREATE TABLE IF NOT EXISTS tasks (
     payload JSONB NULL,
     attempts INT NOT NULL DEFAULT 0,
     error TEXT NULL,
+    scheduled_at TIMESTAMPTZ NOT NULL DEFAULT now(),  -- earliest claim time (retry backoff)
     created_at TIMESTAMPTZ NOT NULL DEFAULT now(),
     updated_at TIMESTAMPTZ NOT NULL DEFAULT now()
 );
 
+-- For databases created before scheduled_at existed
+ALTER TABLE tasks ADD COLUMN IF NOT EXISTS
+    scheduled_at TIMESTAMPTZ NOT NULL DEFAULT now();
+
 CREATE INDEX IF NOT EXISTS idx_tasks_status_priority_created
     ON tasks(status, priority DESC, created_at ASC);
 CREATE INDEX IF NOT EXISTS idx_tasks_ticker_status
     ON tasks(ticker, status);
 
+-- Matches the worker's claim query (WHERE status = 'PENDING' ORDER BY
+-- priority DESC, created_at ASC): covers only the handful of pending
+-- rows, so claims stay O(log pending) no matter how much DONE/ERROR
+-- history accumulates.
+CREATE INDEX IF NOT EXISTS idx_tasks_pending
+    ON tasks(priority DESC, created_at ASC)
+    WHERE status = 'PENDING';
+
+-- For the stale-lease reaper: find RUNNING rows with old updated_at.
+CREATE INDEX IF NOT EXISTS idx_tasks_running_stale
+    ON tasks(updated_at)
+    WHERE status = 'RUNNING';
+
+-- One-off dedupe so the unique index below builds on databases that
+-- already hold duplicate in-flight tasks (the pre-index API created
+-- them freely): keep the newest PENDING/RUNNING row per
+-- (task_type, ticker) and retire the rest.
+UPDATE tasks t
+SET status = 'ERROR',
+    error = 'superseded by a newer duplicate task',
+    updated_at = now()
+WHERE t.status IN ('PENDING', 'RUNNING')
+  AND t.ticker IS NOT NULL
+  AND EXISTS (
+      SELECT 1 FROM tasks n
+      WHERE n.task_type = t.task_type
+        AND n.ticker = t.ticker
+        AND n.status IN ('PENDING', 'RUNNING')
+        AND (n.created_at, n.id) > (t.created_at, t.id)
+  );
+
+-- At most one in-flight task per (task_type, ticker): duplicate
+-- enqueues no-op via ON CONFLICT DO NOTHING in the API instead of
+-- running the same pipeline twice. Global tasks (ticker NULL) are
+-- unaffected because NULLs never collide in a unique index.
+CREATE UNIQUE INDEX IF NOT EXISTS idx_tasks_pending_uniq
+    ON tasks(task_type, ticker)
+    WHERE status IN ('PENDING', 'RUNNING');
+
+-- Wake listening workers the moment a task is enqueued, so the worker's
+-- poll interval is only a safety net instead of added pickup latency.
+CREATE OR REPLACE FUNCTION notify_tasks_new() RETURNS trigger AS $$
+BEGIN
+    IF NEW.status = 'PENDING' THEN
+        PERFORM pg_notify('tasks_new', NEW.id::text);
+    END IF;
+    RETURN NEW;
+END;
+$$ LANGUAGE plpgsql;
+
+DROP TRIGGER IF EXISTS tasks_notify ON tasks;
+CREATE TRIGGER tasks_notify
+    AFTER INSERT ON tasks
+    FOR EACH ROW EXECUTE FUNCTION notify_tasks_new();
+
 -- ============================================
 -- C) prices_daily - historical and daily prices
 -- ============================================
@@ -89,9 +149,16 @@ CREATE TABLE IF NOT EXISTS items (
     CONSTRAINT unique_items_source_url UNIQUE (source, url)
 );
 
+-- Also serves the hot headline fetch (WHERE ticker = ? ORDER BY
+-- published_at DESC LIMIT n): with ticker equality-constrained,
+-- Postgres walks this btree backward, so no separate DESC index.
 CREATE INDEX IF NOT EXISTS idx_items_ticker_published
     ON items(ticker, published_at);
 
+-- Retire the redundant DESC twin on databases that created it; it only
+-- added write amplification on the append-heavy items table.
+DROP INDEX IF EXISTS idx_items_ticker_published_desc;
+
 -- ============================================
 -- E) item_scores - ML sentiment outputs (append-only per model)
 -- ============================================
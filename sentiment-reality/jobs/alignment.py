@@ -1,7 +1,6 @@
-from db import execute, is_configured
+from db import execute, execute_values
 import numpy as np
 import query_db as qdb
-from db import fetch_all
 
 def normalize(num1, num2):
     if num1 is None or num2 is None or num2 == 0:
@@ -62,9 +61,10 @@ def alignment(info:dict):
         print("  [alignment] Required value is None or NaN, returning None.")
         return {"alignment_raw": None, "alignment_weight": None}
 
-    dirr = 1 if np.sign(p) == np.sign(s) else -1
+    # Branchless sign/magnitude: same form SERVER_SIDE_ALIGNMENT_SQL uses
+    dirr = np.where(np.sign(p) == np.sign(s), 1.0, -1.0)
     mag = 1 - np.abs(np.abs(p) - np.abs(s))  # 1 - | |p| - |s| |
-    alignment_raw = dirr * mag
+    alignment_raw = float(dirr * mag)
 
     try:
         alignment_weight = np.sqrt(av_norm * v_norm)
@@ -75,7 +75,63 @@ def alignment(info:dict):
     print(f"  alignment_raw={alignment_raw}, alignment_weight={alignment_weight}")
     return {"alignment_raw": alignment_raw, "alignment_weight": alignment_weight}
 
-    
+UPSERT_ALIGNMENT_SQL = """
+    INSERT INTO alignment_daily (ticker, date, alignment_raw, alignment_weight)
+    VALUES %s
+    ON CONFLICT (ticker, date) DO UPDATE
+        SET alignment_raw = EXCLUDED.alignment_raw,
+            alignment_weight = EXCLUDED.alignment_weight,
+            created_at = now()
+"""
+
+
+# Same math as alignment(), expressed in SQL over prices_daily +
+# daily_agg so a whole day of tickers is computed and upserted without
+# pulling any rows into Python. Rows missing a required input are
+# filtered out, mirroring the scalar function returning Nones.
+SERVER_SIDE_ALIGNMENT_SQL = """
+    INSERT INTO alignment_daily (ticker, date, alignment_raw, alignment_weight)
+    SELECT x.ticker, x.date,
+           (CASE WHEN sign(x.p) = sign(x.s) THEN 1.0 ELSE -1.0 END)
+               * (1 - abs(abs(x.p) - abs(x.s))),
+           sqrt(x.av * x.v)
+    FROM (
+        SELECT today.ticker,
+               today.date,
+               tanh(5 * ln(today.close / prev.close)) AS p,
+               agg.sentiment_avg AS s,
+               COALESCE(LEAST(agg.article_count::float
+                   / NULLIF(prev_agg.article_count, 0), 2.0), 0) / 2.0 AS av,
+               COALESCE(LEAST(today.volume::float
+                   / NULLIF(prev.volume, 0), 2.0), 0) / 2.0 AS v
+        FROM prices_daily today
+        JOIN prices_daily prev
+          ON prev.ticker = today.ticker AND prev.date = today.date - 1
+        JOIN daily_agg agg
+          ON agg.ticker = today.ticker AND agg.date = today.date
+        LEFT JOIN daily_agg prev_agg
+          ON prev_agg.ticker = today.ticker AND prev_agg.date = today.date - 1
+        WHERE today.date = %s
+          AND today.close > 0 AND prev.close > 0
+    ) x
+    WHERE x.s IS NOT NULL
+    ON CONFLICT (ticker, date) DO UPDATE
+        SET alignment_raw = EXCLUDED.alignment_raw,
+            alignment_weight = EXCLUDED.alignment_weight,
+            created_at = now()
+"""
+
+
+def insert_alignment_for_date(date: str) -> int:
+    """
+    Compute and upsert alignment_daily for every ticker with data on the
+    given date, entirely inside Postgres.
+    """
+    count = execute(SERVER_SIDE_ALIGNMENT_SQL, (date,))
+    print(f"✓ Server-side alignment upsert for {date}: {count} tickers")
+    return count
+
+
 def insert_alignment_result(ticker: str, date: str):
     """
     Compute and insert alignment result into alignment_daily table for a ticker and date.
@@ -91,16 +147,9 @@ def insert_alignment_result(ticker: str, date: str):
             alignment_raw = float(alignment_raw)
         if alignment_weight is not None and hasattr(alignment_weight, 'item'):
             alignment_weight = float(alignment_weight)
-        rowcount = execute(
-            """
-            INSERT INTO alignment_daily (ticker, date, alignment_raw, alignment_weight)
-            VALUES (%s, %s, %s, %s)
-            ON CONFLICT (ticker, date) DO UPDATE
-                SET alignment_raw = EXCLUDED.alignment_raw,
-                    alignment_weight = EXCLUDED.alignment_weight,
-                    created_at = now()
-            """,
-            (ticker, date, alignment_raw, alignment_weight)
+        rowcount = execute_values(
+            UPSERT_ALIGNMENT_SQL,
+            [(ticker, date, alignment_raw, alignment_weight)]
         )
         print(f"✓ DB insert/update for {ticker} on {date} (rowcount={rowcount})")
     except Exception as e:
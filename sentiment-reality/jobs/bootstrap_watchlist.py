@@ -6,7 +6,7 @@ Usage: python bootstrap_watchlist.py
 Sets TSLA, NVDA, JPM, PFE, GME as active.
 All other tickers are set to is_active=false.
 """
-from db import execute, fetch_all, is_configured
+from db import execute, execute_values, fetch_all, is_configured
 
 DEFAULT_TICKERS = ["TSLA", "NVDA", "JPM", "PFE", "GME"]
 
@@ -27,14 +27,13 @@ def bootstrap_watchlist():
     deactivated = execute("UPDATE tracked_stocks SET is_active = false")
     print(f"  Deactivated {deactivated} existing tickers")
 
-    # Upsert default tickers as active
-    for ticker in DEFAULT_TICKERS:
-        execute("""
-            INSERT INTO tracked_stocks (ticker, is_active)
-            VALUES (%s, true)
-            ON CONFLICT (ticker) DO UPDATE SET is_active = true
-        """, (ticker,))
-        print(f"  ✓ {ticker} set to active")
+    # Upsert all default tickers as active in one statement
+    upserted = execute_values("""
+        INSERT INTO tracked_stocks (ticker, is_active)
+        VALUES %s
+        ON CONFLICT (ticker) DO UPDATE SET is_active = true
+    """, [(t, True) for t in DEFAULT_TICKERS])
+    print(f"  ✓ {upserted} tickers set to active")
 
     # Show final state
     active = fetch_all("SELECT ticker FROM tracked_stocks WHERE is_active = true ORDER BY ticker")
@@ -52,16 +52,14 @@ def compute_metrics(ticker: str, window_days: int = 7):
         print(f"Not enough common dates for {ticker} (need {window_days}, have {len(common_dates)})")
         return 0
 
-    count = 0
-    for i in range(window_days - 1, len(common_dates)):
-        window_dates = common_dates[i - window_days + 1 : i + 1]
-        date_end = window_dates[-1]
-
-        sentiments_window = [sentiment_by_date[d] for d in window_dates]
-        returns_window = [return_by_date[d] for d in window_dates]
+    # Compute every window in one vectorized pass
+    s_arr = np.array([sentiment_by_date[d] for d in common_dates], dtype=float)
+    r_arr = np.array([return_by_date[d] for d in common_dates], dtype=float)
+    all_metrics = _compute_window_metrics_all(s_arr, r_arr, window_days)
 
-        # Compute metrics
-        metrics = _compute_window_metrics(sentiments_window, returns_window)
+    count = 0
+    for i, metrics in enumerate(all_metrics):
+        date_end = common_dates[i + window_days - 1]
 
         # Upsert
         execute("""
@@ -91,6 +89,59 @@ def compute_metrics(ticker: str, window_days: int = 7):
     return count
 
 
+def _compute_window_metrics_all(sentiments: np.ndarray, returns: np.ndarray, window_days: int) -> list[dict]:
+    """
+    Compute metrics for every rolling window at once.
+
+    sliding_window_view lays the (N-W+1, W) window matrices over the
+    input arrays without copying, so all correlations come from one
+    broadcasted mean-subtraction plus row-wise reductions instead of an
+    np.corrcoef call per window. Same formulas and thresholds as
+    _compute_window_metrics; returns one dict per window, oldest first.
+    """
+    from numpy.lib.stride_tricks import sliding_window_view
+
+    S = sliding_window_view(sentiments, window_days)
+    R = sliding_window_view(returns, window_days)
+
+    Sc = S - S.mean(axis=1, keepdims=True)
+    Rc = R - R.mean(axis=1, keepdims=True)
+    num = (Sc * Rc).sum(axis=1)
+    den = np.sqrt((Sc ** 2).sum(axis=1) * (Rc ** 2).sum(axis=1))
+
+    # Same degenerate-window guard as the scalar helper (std < 0.001)
+    std_s = S.std(axis=1)
+    std_r = R.std(axis=1)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        corr = np.where((std_s < 0.001) | (std_r < 0.001), 0.0, num / den)
+    corr = np.nan_to_num(corr)
+
+    matches = (np.sign(S) == np.sign(R)).sum(axis=1)
+    directional_match = matches / window_days
+    misalignment_days = window_days - matches
+    alignment_score = np.clip(0.5 * corr + 0.5 * (directional_match * 2 - 1), -1.0, 1.0)
+
+    results = []
+    for i in range(len(corr)):
+        score = alignment_score[i]
+        if score >= 0.3:
+            interpretation = "Aligned"
+        elif score <= -0.3:
+            interpretation = "Misleading"
+        else:
+            interpretation = "Noisy"
+
+        results.append({
+            "corr": float(round(corr[i], 4)),
+            "directional_match": float(round(directional_match[i], 4)),
+            "alignment_score": float(round(score, 4)),
+            "misalignment_days": int(misalignment_days[i]),
+            "interpretation": interpretation,
+        })
+
+    return results
+
+
 def _compute_window_metrics(sentiments: list, returns: list) -> dict:
     """
     Compute metrics for a single window.
@@ -104,16 +155,23 @@ def _compute_window_metrics(sentiments: list, returns: list) -> dict:
     - alignment_score <= -0.3: "Misleading"
     - else: "Noisy"
     """
-    sentiments = np.array(sentiments)
-    returns = np.array(returns)
-
-    # Correlation (handle edge cases)
-    if np.std(sentiments) < 0.001 or np.std(returns) < 0.001:
+    sentiments = np.array(sentiments, dtype=float)
+    returns = np.array(returns, dtype=float)
+
+    # Correlation via the closed-form Pearson formula - np.corrcoef
+    # builds a 2x2 covariance matrix just to read one cell, so three
+    # dot products do the same work with no temp matrix. ds/dr are sums
+    # of squared deviations (n * variance), so comparing against
+    # n * 0.001**2 is exactly the std < 0.001 degenerate-window guard
+    # and also covers the nan case.
+    s = sentiments - sentiments.mean()
+    r = returns - returns.mean()
+    ds = float(np.dot(s, s))
+    dr = float(np.dot(r, r))
+    if ds < len(s) * 1e-6 or dr < len(r) * 1e-6:
         corr = 0.0
     else:
-        corr = float(np.corrcoef(sentiments, returns)[0, 1])
-        if np.isnan(corr):
-            corr = 0.0
+        corr = float(np.dot(s, r) / np.sqrt(ds * dr))
 
     # Directional match
     # sign(0) = 0, so we count it as matching if both are ~0
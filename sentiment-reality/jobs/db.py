@@ -1,8 +1,12 @@
 """Database helper for jobs."""
+import atexit
 import os
+import threading
 from pathlib import Path
 import psycopg2
 from psycopg2.extras import RealDictCursor
+from psycopg2 import extras as pg_extras
+from psycopg2 import pool as pg_pool
 from contextlib import contextmanager
 from dotenv import load_dotenv
 
@@ -46,41 +50,88 @@ def is_configured() -> bool:
 
 
 def get_conn():
-    """Get a database connection (caller must close)."""
+    """Get a dedicated database connection (caller must close)."""
     config = get_db_config()
     if not config:
         raise RuntimeError("DATABASE_URL not configured. Set it in .env file.")
     return psycopg2.connect(**config)
 
 
+# Process-wide connection pool: jobs that loop over tickers (and the
+# thread-pool fan-outs) reuse warm connections instead of paying a
+# TCP+TLS handshake per statement. Created lazily on first use.
+POOL_MIN_CONN = 1
+POOL_MAX_CONN = 16
+
+_pool = None
+_pool_lock = threading.Lock()
+
+
+def _get_pool() -> pg_pool.ThreadedConnectionPool:
+    global _pool
+    if _pool is None:
+        with _pool_lock:
+            if _pool is None:
+                config = get_db_config()
+                if not config:
+                    raise RuntimeError("DATABASE_URL not configured. Set it in .env file.")
+                _pool = pg_pool.ThreadedConnectionPool(POOL_MIN_CONN, POOL_MAX_CONN, **config)
+    return _pool
+
+
+@atexit.register
+def _close_pool():
+    """Close pooled connections on interpreter exit."""
+    global _pool
+    if _pool is not None:
+        _pool.closeall()
+        _pool = None
+
+
 @contextmanager
 def get_connection():
-    """Get a database connection as context manager."""
-    conn = get_conn()
+    """Borrow a pooled connection; it returns to the pool on exit."""
+    pool = _get_pool()
+    conn = pool.getconn()
     try:
         yield conn
+    except Exception:
+        conn.rollback()
+        raise
     finally:
-        conn.close()
+        pool.putconn(conn, close=conn.closed != 0)
 
 
 @contextmanager
 def transaction():
     """Context manager for a transaction. Auto-commits on success, rolls back on error."""
-    conn = get_conn()
-    try:
+    with get_connection() as conn:
+        try:
+            yield conn
+            conn.commit()
+        except Exception:
+            conn.rollback()
+            raise
+
+
+@contextmanager
+def _maybe_connection(conn=None):
+    """
+    Yield the supplied connection, or open (and later close) a fresh one.
+    Lets callers share a single connection across several helper calls
+    instead of paying a connect/handshake per statement.
+    """
+    if conn is not None:
         yield conn
-        conn.commit()
-    except Exception:
-        conn.rollback()
-        raise
-    finally:
-        conn.close()
+    else:
+        with get_connection() as new_conn:
+            yield new_conn
 
 
-def fetch_all(sql: str, params: tuple = None) -> list[dict]:
+def fetch_all(sql: str, params: tuple = None, conn=None) -> list[dict]:
     """Execute SELECT and return list of dicts."""
-    with get_connection() as conn:
-        with conn.cursor(cursor_factory=RealDictCursor) as cur:
+    with _maybe_connection(conn) as c:
+        with c.cursor(cursor_factory=RealDictCursor) as cur:
             cur.execute(sql, params)
             return [dict(row) for row in cur.fetchall()]
 
@@ -89,23 +140,60 @@ def fetch_all(sql: str, params: tuple = None) -> list[dict]:
 query = fetch_all
 
 
-def execute(sql: str, params: tuple = None) -> int:
-    """Execute INSERT/UPDATE/DELETE and return affected row count."""
-    with get_connection() as conn:
-        with conn.cursor() as cur:
+def fetch_iter(sql: str, params: tuple = None, itersize: int = 50, conn=None):
+    """
+    Execute a SELECT on a server-side (named) cursor and yield dict rows.
+    Rows stream from the server `itersize` at a time, so client memory
+    stays O(itersize) no matter how large the result set is - use this
+    instead of fetch_all for scans that can grow.
+    """
+    with _maybe_connection(conn) as c:
+        with c.cursor(name="stream_cursor", cursor_factory=RealDictCursor) as cur:
+            cur.itersize = itersize
             cur.execute(sql, params)
-            conn.commit()
+            for row in cur:
+                yield dict(row)
+
+
+def execute(sql: str, params: tuple = None, conn=None) -> int:
+    """
+    Execute INSERT/UPDATE/DELETE and return affected row count.
+    With a supplied conn the caller owns the transaction boundary
+    (commit/rollback); otherwise the statement commits on its own.
+    """
+    with _maybe_connection(conn) as c:
+        with c.cursor() as cur:
+            cur.execute(sql, params)
+            if conn is None:
+                c.commit()
             return cur.rowcount
 
 
-def execute_many(sql: str, params_list: list[tuple]) -> int:
-    """Execute many INSERTs."""
+def execute_many(sql: str, params_list: list[tuple], conn=None) -> int:
+    """Execute many INSERTs. Transaction ownership as in execute()."""
     if not params_list:
         return 0
-    with get_connection() as conn:
-        with conn.cursor() as cur:
+    with _maybe_connection(conn) as c:
+        with c.cursor() as cur:
             cur.executemany(sql, params_list)
-            conn.commit()
+            if conn is None:
+                c.commit()
+            return cur.rowcount
+
+
+def execute_values(sql: str, rows: list[tuple], page_size: int = 200, conn=None) -> int:
+    """
+    Execute a multi-row INSERT/UPSERT in one statement.
+    sql must contain a single VALUES %s placeholder.
+    Transaction ownership as in execute().
+    """
+    if not rows:
+        return 0
+    with _maybe_connection(conn) as c:
+        with c.cursor() as cur:
+            pg_extras.execute_values(cur, sql, rows, page_size=page_size)
+            if conn is None:
+                c.commit()
             return cur.rowcount
 
 
@@ -1,17 +1,87 @@
 import requests
-from datetime import datetime, timedelta, timezone
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+from datetime import date, datetime, timedelta, timezone
+from functools import lru_cache
 from typing import List, Dict, Any
 import os
 from pathlib import Path
 from dotenv import load_dotenv
-from newspaper import Article
+from newspaper import Article, Config
 import yfinance as yf
-import psycopg2
 
 # Load .env from project root (one level up from jobs/)
 env_path = Path(__file__).parent.parent / '.env'
 load_dotenv(env_path)
 
+# One shared HTTP session for all article/API fetches: keep-alive reuses
+# TCP+TLS connections across requests, and transient 5xx errors get a
+# few retries with backoff instead of failing the article outright.
+_SESSION = requests.Session()
+_SESSION.mount('https://', HTTPAdapter(
+    pool_maxsize=32,
+    max_retries=Retry(total=3, backoff_factor=0.3, status_forcelist=[500, 502, 503, 504]),
+))
+_SESSION.headers['User-Agent'] = (
+    'Mozilla/5.0 (X11; Linux x86_64) AppleWebKit/537.36 '
+    '(KHTML, like Gecko) Chrome/120.0 Safari/537.36'
+)
+
+# Hosts that are hard-paywalled or JS-only: newspaper3k either times
+# out or extracts nothing from them, so skip the download entirely
+_PAYWALLED_HOSTS = {
+    'wsj.com',
+    'ft.com',
+    'bloomberg.com',
+    'barrons.com',
+    'economist.com',
+    'seekingalpha.com',
+}
+
+
+def _is_paywalled(url: str) -> bool:
+    """Check whether a URL's host is on the paywalled-host denylist."""
+    from urllib.parse import urlparse
+    host = urlparse(url).netloc.split(':')[0].lower().removeprefix('www.')
+    return host in _PAYWALLED_HOSTS
+
+
+# Minimal newspaper3k config: we only need article.text, so skip the
+# image fetching, article memoization and meta-refresh follows that the
+# default Configuration runs per article
+_ARTICLE_CFG = Config()
+_ARTICLE_CFG.fetch_images = False
+_ARTICLE_CFG.memoize_articles = False
+_ARTICLE_CFG.follow_meta_refresh = False
+_ARTICLE_CFG.language = 'en'
+_ARTICLE_CFG.request_timeout = 10
+_ARTICLE_CFG.browser_user_agent = _SESSION.headers['User-Agent']
+
+
+# Process-local caches for yfinance lookups. Jobs are short-lived batch
+# runs, so data cached for the lifetime of the process is fresh enough.
+
+@lru_cache(maxsize=64)
+def _get_ticker(stock_symbol: str) -> yf.Ticker:
+    """Get a yf.Ticker, reusing one object per symbol per process."""
+    return yf.Ticker(stock_symbol)
+
+
+@lru_cache(maxsize=64)
+def _get_fast_info(stock_symbol: str):
+    """
+    Fetch ticker.fast_info once per symbol per process. Unlike .info
+    (a large scraped JSON blob), fast_info only pulls the handful of
+    price fields we actually read.
+    """
+    return _get_ticker(stock_symbol).fast_info
+
+
+@lru_cache(maxsize=256)
+def _get_history(stock_symbol: str, start: str, end: str):
+    """Fetch a price history window once per (symbol, start, end)."""
+    return _get_ticker(stock_symbol).history(start=start, end=end)
+
 
 def get_stock_price_data(stock_symbol: str) -> Dict[str, Any]:
     """
@@ -28,11 +98,10 @@ def get_stock_price_data(stock_symbol: str) -> Dict[str, Any]:
             - price_direction (str): 'up', 'down', or 'neutral'
     """
     try:
-        ticker = yf.Ticker(stock_symbol)
-        info = ticker.info
-        
-        current_price = info.get('currentPrice') or info.get('regularMarketPrice')
-        previous_close = info.get('previousClose')
+        fast_info = _get_fast_info(stock_symbol)
+
+        current_price = fast_info.last_price
+        previous_close = fast_info.previous_close
         
         if not current_price:
             return {
@@ -70,6 +139,54 @@ def get_stock_price_data(stock_symbol: str) -> Dict[str, Any]:
         }
 
 
+@lru_cache(maxsize=512)
+def _day_window(d_iso: str) -> tuple:
+    """
+    Lookup windows around a YYYY-MM-DD date: (5 days before, day after).
+    Many articles share a publish date, so cache the parse/format work.
+    """
+    d = date.fromisoformat(d_iso)
+    return (d - timedelta(days=5)).isoformat(), (d + timedelta(days=1)).isoformat()
+
+
+def _fetch_price_for_date(stock_symbol: str, published_date: str) -> Dict[str, Any]:
+    """
+    Fetch the close price, change and direction for a stock on a given
+    date (YYYY-MM-DD). Returns Nones/'unknown' when no data is available.
+    """
+    price = None
+    price_change = None
+    price_direction = 'unknown'
+
+    try:
+        prev_start, next_day = _day_window(published_date)
+        df = _get_history(stock_symbol, published_date, next_day)
+
+        if not df.empty:
+            row = df.iloc[0]
+            price = round(float(row['Close']), 2)
+
+            # Get previous close for price change if available
+            prev_df = _get_history(stock_symbol, prev_start, published_date)
+            if len(prev_df) > 1:
+                prev_close = float(prev_df.iloc[-2]['Close'])
+                price_change = round(price - prev_close, 2)
+                if price_change > 0:
+                    price_direction = 'up'
+                elif price_change < 0:
+                    price_direction = 'down'
+                else:
+                    price_direction = 'neutral'
+    except Exception as e:
+        print(f"Error fetching price for {stock_symbol} on {published_date}: {e}")
+
+    return {
+        'price': price,
+        'price_change': price_change,
+        'price_direction': price_direction,
+    }
+
+
 def get_news_data(stock_symbol: str, hours: int = 168) -> List[Dict[str, Any]]:
     """
     Fetch article information from NewsAPI for a given stock symbol from the specified timeframe.
@@ -119,8 +236,10 @@ def get_news_data(stock_symbol: str, hours: int = 168) -> List[Dict[str, Any]]:
             'apiKey': api_key
         }
         
-        # Make the request
-        response = requests.get(api_url, params=params, timeout=10)
+        # Make the request over the shared keep-alive session; repeated
+        # pipeline runs hit NewsAPI back-to-back, so connection reuse
+        # skips a TLS handshake per call (responses arrive gzipped)
+        response = _SESSION.get(api_url, params=params, timeout=10)
         response.raise_for_status()
         
         # Parse the response
@@ -132,55 +251,47 @@ def get_news_data(stock_symbol: str, hours: int = 168) -> List[Dict[str, Any]]:
             return []
         
         # Extract article information
-        articles = data.get('articles', [])
+        articles = [a for a in data.get('articles', []) if a.get('url')]
+
+        # Many articles share a publication date, so fetch the price once
+        # per unique date - and do the lookups concurrently, since each
+        # one is a network call to Yahoo
+        # NewsAPI dates are ISO8601, so the date is just the first 10
+        # characters - no parsing needed
+        unique_dates = {
+            a['publishedAt'][:10]
+            for a in articles
+            if a.get('publishedAt')
+        }
+
+        prices_by_date: Dict[str, Dict[str, Any]] = {}
+        if unique_dates:
+            from concurrent.futures import ThreadPoolExecutor
+            with ThreadPoolExecutor(max_workers=min(8, len(unique_dates))) as pool:
+                results = pool.map(
+                    lambda d: (d, _fetch_price_for_date(stock_symbol, d)),
+                    unique_dates,
+                )
+            prices_by_date = dict(results)
+
+        no_price = {'price': None, 'price_change': None, 'price_direction': 'unknown'}
         for article in articles:
-            article_url = article.get('url')
-            if article_url:
-                published_at = article.get('publishedAt', '')
-                
-                # Extract date from published_at and get price for that date
-                try:
-                    published_date = published_at.split('T')[0] if published_at else ''
-                    ticker = yf.Ticker(stock_symbol)
-                    df = ticker.history(start=published_date, end=(datetime.fromisoformat(published_date) + timedelta(days=1)).strftime("%Y-%m-%d"))
-                    
-                    price = None
-                    price_change = None
-                    price_direction = 'unknown'
-                    
-                    if not df.empty:
-                        row = df.iloc[0]
-                        price = round(float(row['Close']), 2)
-                        
-                        # Get previous close for price change if available
-                        prev_df = ticker.history(start=(datetime.fromisoformat(published_date) - timedelta(days=5)).strftime("%Y-%m-%d"), end=published_date)
-                        if len(prev_df) > 1:
-                            prev_close = float(prev_df.iloc[-2]['Close'])
-                            price_change = round(price - prev_close, 2)
-                            if price_change > 0:
-                                price_direction = 'up'
-                            elif price_change < 0:
-                                price_direction = 'down'
-                            else:
-                                price_direction = 'neutral'
-                except Exception as e:
-                    print(f"Error fetching price for {stock_symbol} on {published_date}: {e}")
-                    price = None
-                    price_change = None
-                    price_direction = 'unknown'
-                
-                article_info = {
-                    'url': article_url,
-                    'headline': article.get('title', ''),
-                    'source': article.get('source', {}).get('name', 'Unknown'),
-                    'published_at': published_at,
-                    'stock_symbol': stock_symbol,
-                    'price': price,
-                    'price_timestamp': published_at,
-                    'price_change': price_change,
-                    'price_direction': price_direction
-                }
-                articles_info.append(article_info)
+            published_at = article.get('publishedAt', '')
+            published_date = published_at[:10]
+            price_data = prices_by_date.get(published_date, no_price)
+
+            article_info = {
+                'url': article['url'],
+                'headline': article.get('title', ''),
+                'source': article.get('source', {}).get('name', 'Unknown'),
+                'published_at': published_at,
+                'stock_symbol': stock_symbol,
+                'price': price_data['price'],
+                'price_timestamp': published_at,
+                'price_change': price_data['price_change'],
+                'price_direction': price_data['price_direction']
+            }
+            articles_info.append(article_info)
     
     except requests.exceptions.RequestException as e:
         print(f"Error fetching articles from NewsAPI: {e}")
@@ -200,25 +311,82 @@ def get_article_text(url: str) -> str:
     Returns:
         str: The article text content as plain text, or empty string if extraction fails
     """
+    if _is_paywalled(url):
+        return ""
+
     try:
-        # Create an Article object from newspaper3k
-        article = Article(url, keep_article_html=False)
-        
-        # Download the article
-        article.download()
-        
+        # Fetch the HTML over the shared keep-alive session, then hand it
+        # to newspaper3k so it skips its own one-shot download
+        resp = _SESSION.get(url, timeout=10)
+        resp.raise_for_status()
+
+        article = Article(url, keep_article_html=False, config=_ARTICLE_CFG)
+        article.download(input_html=resp.text)
+
         # Parse the article content
         article.parse()
-        
+
         # Return the extracted text
         text = article.text
-        
+
         return text if text else ""
-    
+
+    except Exception:
+        return ""
+
+
+def _fetch_html(url: str) -> str:
+    """Download raw HTML for a URL over the shared session ("" on failure)."""
+    if _is_paywalled(url):
+        return ""
+    try:
+        resp = _SESSION.get(url, timeout=10)
+        resp.raise_for_status()
+        return resp.text
     except Exception:
         return ""
 
 
+def get_article_texts(urls: List[str], max_workers: int = 8) -> Dict[str, str]:
+    """
+    Extract article text for many URLs concurrently.
+
+    Downloads run in a thread pool (network-bound, so threads overlap
+    the waiting), while the CPU- and memory-heavy newspaper3k parse runs
+    serially afterwards - parallel parses just fight over the GIL and
+    multiply peak memory.
+
+    Args:
+        urls: Article URLs to fetch
+        max_workers: Max concurrent downloads (default: 8)
+
+    Returns:
+        Dict mapping url -> extracted text ("" where extraction failed)
+    """
+    if not urls:
+        return {}
+
+    from concurrent.futures import ThreadPoolExecutor
+
+    with ThreadPoolExecutor(max_workers=min(max_workers, len(urls))) as pool:
+        htmls = dict(zip(urls, pool.map(_fetch_html, urls)))
+
+    texts = {}
+    for url, html in htmls.items():
+        if not html:
+            texts[url] = ""
+            continue
+        try:
+            article = Article(url, keep_article_html=False, config=_ARTICLE_CFG)
+            article.download(input_html=html)
+            article.parse()
+            texts[url] = article.text or ""
+        except Exception:
+            texts[url] = ""
+
+    return texts
+
+
 def get_daily_metrics(symbol: str, current_day: str, previous_day: str) -> dict:
     """
     Retrieve close and volume for current and previous day from prices_daily,
@@ -238,48 +406,35 @@ def get_daily_metrics(symbol: str, current_day: str, previous_day: str) -> dict:
             'sentiment_avg': float
         }
     """
-    # Get DB credentials from environment variables
-    db_host = os.getenv("SUPABASE_DB_HOST")
-    db_name = os.getenv("SUPABASE_DB_NAME")
-    db_user = os.getenv("SUPABASE_DB_USER")
-    db_pass = os.getenv("SUPABASE_DB_PASSWORD")
-    db_port = os.getenv("SUPABASE_DB_PORT", "5432")
-
-    conn = psycopg2.connect(
-        host=db_host,
-        dbname=db_name,
-        user=db_user,
-        password=db_pass,
-        port=db_port
-    )
-    cursor = conn.cursor()
-
-    # Current day close and volume
-    cursor.execute("""
-        SELECT close, volume FROM prices_daily
-        WHERE symbol = %s AND date = %s
-    """, (symbol, current_day))
-    current_row = cursor.fetchone()
-    current_close, current_volume = current_row if current_row else (None, None)
-
-    # Previous day close and volume
-    cursor.execute("""
-        SELECT close, volume FROM prices_daily
-        WHERE symbol = %s AND date = %s
-    """, (symbol, previous_day))
-    prev_row = cursor.fetchone()
-    previous_close, previous_volume = prev_row if prev_row else (None, None)
-
-    # Sentiment avg for current day
-    cursor.execute("""
-        SELECT sentiment_avg FROM daily_agg
-        WHERE symbol = %s AND date = %s
-    """, (symbol, current_day))
-    sentiment_row = cursor.fetchone()
-    sentiment_avg = sentiment_row[0] if sentiment_row else None
-
-    cursor.close()
-    conn.close()
+    from db import get_connection
+
+    # Run all three lookups on one shared connection in one transaction
+    # instead of opening a dedicated connection per call
+    with get_connection() as conn:
+        with conn.cursor() as cursor:
+            # Current day close and volume
+            cursor.execute("""
+                SELECT close, volume FROM prices_daily
+                WHERE symbol = %s AND date = %s
+            """, (symbol, current_day))
+            current_row = cursor.fetchone()
+            current_close, current_volume = current_row if current_row else (None, None)
+
+            # Previous day close and volume
+            cursor.execute("""
+                SELECT close, volume FROM prices_daily
+                WHERE symbol = %s AND date = %s
+            """, (symbol, previous_day))
+            prev_row = cursor.fetchone()
+            previous_close, previous_volume = prev_row if prev_row else (None, None)
+
+            # Sentiment avg for current day
+            cursor.execute("""
+                SELECT sentiment_avg FROM daily_agg
+                WHERE symbol = %s AND date = %s
+            """, (symbol, current_day))
+            sentiment_row = cursor.fetchone()
+            sentiment_avg = sentiment_row[0] if sentiment_row else None
 
     return {
         'current_close': current_close,
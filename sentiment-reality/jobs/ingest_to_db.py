@@ -7,7 +7,16 @@ Functions:
 """
 import sys
 from ingest_news import get_news_data, get_article_text
-from db import execute, query
+from db import execute, execute_values, query
+
+# created_at falls back to its DEFAULT now()
+INSERT_ITEMS_SQL = """
+    INSERT INTO items
+    (ticker, source, published_at, title, url, snippet,
+     current_price, price_timestamp, price_change, price_direction)
+    VALUES %s
+    ON CONFLICT (source, url) DO NOTHING
+"""
 
 
 def ingest_news_to_db(stock_symbol: str, hours: int = 168) -> dict:
@@ -39,48 +48,42 @@ def ingest_news_to_db(stock_symbol: str, hours: int = 168) -> dict:
     inserted = 0
     skipped = 0
     errors = []
-    
-    for i, article in enumerate(articles, 1):
-        try:
-            # Check if URL already exists
-            existing = query(
-                "SELECT id FROM items WHERE url = %s",
-                (article['url'],)
-            )
-            
-            if existing:
-                skipped += 1
-                print(f"  [{i}/{total}] ⏭️  SKIPPED (duplicate): {article['headline'][:60]}...")
-                continue
-            
-            # Insert article metadata with price data
-            execute("""
-                INSERT INTO items 
-                (ticker, source, published_at, title, url, snippet,
-                 current_price, price_timestamp, price_change, price_direction, created_at)
-                VALUES (%s, %s, %s, %s, %s, %s, %s, %s, %s, %s, now())
-                ON CONFLICT (source, url) DO NOTHING
-            """, (
-                stock_symbol.upper(),
-                article.get('source', 'Unknown'),
-                article.get('published_at'),
-                article.get('headline', 'No title'),
-                article['url'],
-                article.get('snippet', ''),
-                article.get('price'),
-                article.get('price_timestamp'),
-                article.get('price_change'),
-                article.get('price_direction')
-            ))
-            
-            inserted += 1
-            print(f"  [{i}/{total}] ✓ INSERTED: {article['headline'][:60]}...")
-            
-        except Exception as e:
-            error_msg = str(e)[:200]
-            errors.append(error_msg)
-            print(f"  [{i}/{total}] ❌ ERROR: {error_msg}")
-    
+
+    # Drop URLs we already have with one ANY() lookup before doing any
+    # further per-article work; ON CONFLICT below still catches races
+    urls = [article['url'] for article in articles]
+    existing = {
+        row['url']
+        for row in query("SELECT url FROM items WHERE url = ANY(%s)", (urls,))
+    }
+    if existing:
+        articles = [a for a in articles if a['url'] not in existing]
+        print(f"Skipping {len(existing)} articles already in DB")
+
+    # Build all rows and upsert them in one multi-row statement;
+    # ON CONFLICT DO NOTHING handles duplicates server-side
+    rows = [(
+        stock_symbol.upper(),
+        article.get('source', 'Unknown'),
+        article.get('published_at'),
+        article.get('headline', 'No title'),
+        article['url'],
+        article.get('snippet', ''),
+        article.get('price'),
+        article.get('price_timestamp'),
+        article.get('price_change'),
+        article.get('price_direction')
+    ) for article in articles]
+
+    try:
+        if rows:
+            inserted = execute_values(INSERT_ITEMS_SQL, rows)
+        skipped = total - inserted
+    except Exception as e:
+        error_msg = str(e)[:200]
+        errors.append(error_msg)
+        print(f"  ❌ ERROR: {error_msg}")
+
     result = {
         'total_articles': total,
         'inserted_count': inserted,
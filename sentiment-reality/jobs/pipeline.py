@@ -9,7 +9,94 @@ Provides run_pipeline_for_ticker() which runs the full pipeline:
 5. Metrics windowed -> upsert metrics_windowed
 """
 from datetime import datetime
-from db import execute, fetch_all, get_connection
+from db import execute, execute_values, fetch_all, transaction
+
+
+# ============================================================
+# SQL statements (module-level so every call reuses one string)
+# ============================================================
+
+_UPSERT_PRICES_SQL = """
+    INSERT INTO prices_daily (ticker, date, open, high, low, close, adj_close, volume)
+    VALUES %s
+    ON CONFLICT (ticker, date) DO UPDATE SET
+        open = EXCLUDED.open,
+        high = EXCLUDED.high,
+        low = EXCLUDED.low,
+        close = EXCLUDED.close,
+        adj_close = EXCLUDED.adj_close,
+        volume = EXCLUDED.volume
+"""
+
+_UPDATE_RETURNS_SQL = """
+    WITH returns AS (
+        SELECT
+            ticker,
+            date,
+            (close - LAG(close) OVER (PARTITION BY ticker ORDER BY date)) /
+                NULLIF(LAG(close) OVER (PARTITION BY ticker ORDER BY date), 0) * 100 AS return_1d
+        FROM prices_daily
+        WHERE ticker = %s AND date >= %s::date - 7
+    )
+    UPDATE prices_daily p
+    SET return_1d = r.return_1d
+    FROM returns r
+    WHERE p.ticker = r.ticker AND p.date = r.date
+      AND p.date >= %s
+      AND r.return_1d IS DISTINCT FROM p.return_1d
+"""
+
+_UPSERT_DAILY_AGG_SQL = """
+    INSERT INTO daily_agg (ticker, date, sentiment_avg, article_count,
+                           positive_count, neutral_count, negative_count)
+    SELECT
+        i.ticker,
+        DATE(i.published_at) as date,
+        COALESCE(AVG(s.sentiment_score), 0) as sentiment_avg,
+        COUNT(*) as article_count,
+        SUM(CASE WHEN s.sentiment_label = 'POSITIVE' THEN 1 ELSE 0 END) as positive_count,
+        SUM(CASE WHEN s.sentiment_label = 'NEUTRAL' THEN 1 ELSE 0 END) as neutral_count,
+        SUM(CASE WHEN s.sentiment_label = 'NEGATIVE' THEN 1 ELSE 0 END) as negative_count
+    FROM items i
+    JOIN item_scores s ON i.id = s.item_id
+    -- Compare the raw timestamp, not DATE(published_at): the bare
+    -- column keeps the predicate sargable for idx_items_ticker_published
+    WHERE i.ticker = %s AND i.published_at >= %s
+    GROUP BY i.ticker, DATE(i.published_at)
+    ON CONFLICT (ticker, date) DO UPDATE SET
+        sentiment_avg = EXCLUDED.sentiment_avg,
+        article_count = EXCLUDED.article_count,
+        positive_count = EXCLUDED.positive_count,
+        neutral_count = EXCLUDED.neutral_count,
+        negative_count = EXCLUDED.negative_count
+"""
+
+_SELECT_JOINED_SERIES_SQL = """
+    SELECT d.date, d.sentiment_avg, p.return_1d
+    FROM daily_agg d
+    JOIN prices_daily p ON p.ticker = d.ticker AND p.date = d.date
+    WHERE d.ticker = %s AND d.date >= %s AND p.return_1d IS NOT NULL
+    ORDER BY d.date
+"""
+
+_SELECT_LAST_WINDOW_SQL = """
+    SELECT max(date_end) AS last_end
+    FROM metrics_windowed
+    WHERE ticker = %s AND window_days = %s
+"""
+
+_UPSERT_METRICS_SQL = """
+    INSERT INTO metrics_windowed
+        (ticker, date_end, window_days, corr, directional_match,
+         alignment_score, misalignment_days, interpretation)
+    VALUES %s
+    ON CONFLICT (ticker, date_end, window_days) DO UPDATE SET
+        corr = EXCLUDED.corr,
+        directional_match = EXCLUDED.directional_match,
+        alignment_score = EXCLUDED.alignment_score,
+        misalignment_days = EXCLUDED.misalignment_days,
+        interpretation = EXCLUDED.interpretation
+"""
 
 
 def run_pipeline_for_ticker(
@@ -72,29 +159,33 @@ def run_pipeline_for_ticker(
         summary["steps"]["score_items"] = score_result
         print(f"      → Scored {score_result.get('scored', 0)}/{score_result.get('selected', 0)}")
 
-        # Step 3: Ingest prices
-        print("\n[3/5] Ingesting prices...")
-        prices_result = ingest_prices(ticker, days=prices_days)
-        summary["steps"]["ingest_prices"] = prices_result
-        print(f"      → Stored {prices_result.get('count', 0)} price records")
-
-        # Step 4: Compute daily aggregates
-        print("\n[4/5] Computing daily aggregates...")
-        agg_result = compute_daily_agg(ticker, days=agg_days)
-        summary["steps"]["daily_agg"] = agg_result
-        print(f"      → Updated {agg_result.get('count', 0)} daily aggregates")
-
-        # Step 5: Compute metrics for all window sizes
-        print("\n[5/5] Computing metrics...")
-        metrics_results = {}
-        total_metrics = 0
-        for wd in windows:
-            result = compute_metrics_windowed(ticker, window_days=wd, days=metrics_days)
-            metrics_results[f"window_{wd}"] = result
-            total_metrics += result.get("count", 0)
-            print(f"      → Window {wd}d: {result.get('count', 0)} rows")
-        summary["steps"]["metrics"] = metrics_results
-        print(f"      → Total: {total_metrics} metric rows")
+        # Steps 3-5 are pure DB work: share one connection and one
+        # transaction across them - a ticker's prices, aggregates and
+        # metrics land atomically with a single commit/fsync
+        with transaction() as conn:
+            # Step 3: Ingest prices
+            print("\n[3/5] Ingesting prices...")
+            prices_result = ingest_prices(ticker, days=prices_days, conn=conn)
+            summary["steps"]["ingest_prices"] = prices_result
+            print(f"      → Stored {prices_result.get('count', 0)} price records")
+
+            # Step 4: Compute daily aggregates
+            print("\n[4/5] Computing daily aggregates...")
+            agg_result = compute_daily_agg(ticker, days=agg_days, conn=conn)
+            summary["steps"]["daily_agg"] = agg_result
+            print(f"      → Updated {agg_result.get('count', 0)} daily aggregates")
+
+            # Step 5: Compute metrics for all window sizes
+            print("\n[5/5] Computing metrics...")
+            metrics_results = {}
+            total_metrics = 0
+            for wd in windows:
+                result = compute_metrics_windowed(ticker, window_days=wd, days=metrics_days, conn=conn)
+                metrics_results[f"window_{wd}"] = result
+                total_metrics += result.get("count", 0)
+                print(f"      → Window {wd}d: {result.get('count', 0)} rows")
+            summary["steps"]["metrics"] = metrics_results
+            print(f"      → Total: {total_metrics} metric rows")
 
         summary["success"] = True
 
@@ -114,6 +205,24 @@ def run_pipeline_for_ticker(
     return summary
 
 
+def run_pipeline_for_tickers(tickers: list[str], max_workers: int = 8, **kwargs) -> list[dict]:
+    """
+    Run the full pipeline for several tickers in parallel.
+
+    The pipeline is dominated by network waits (NewsAPI, yfinance,
+    Postgres round-trips), so a thread pool overlaps them well; results
+    come back in the same order as the input tickers. kwargs are passed
+    through to run_pipeline_for_ticker.
+    """
+    if not tickers:
+        return []
+
+    from concurrent.futures import ThreadPoolExecutor
+
+    with ThreadPoolExecutor(max_workers=min(max_workers, len(tickers))) as pool:
+        return list(pool.map(lambda t: run_pipeline_for_ticker(t, **kwargs), tickers))
+
+
 # ============================================================
 # Step implementations
 # ============================================================
@@ -142,20 +251,43 @@ def score_items(ticker: str, limit: int) -> dict:
     }
 
 
-def ingest_prices(ticker: str, days: int) -> dict:
-    """Ingest prices and compute returns."""
-    from providers.prices import fetch_daily_prices
+# Above this many price rows, COPY into a staging table beats even a
+# batched multi-row insert (multi-year backfills; ~500 is two years)
+COPY_THRESHOLD = 500
+
+# Windows ending within this many days are recomputed on every metrics
+# run: daily ingestion pulls up to ~48h of news (and stragglers), so
+# recent daily_agg rows - and the windows built on them - keep moving
+# after they are first stored.
+_METRICS_REFRESH_TAIL_DAYS = 7
 
-    prices = fetch_daily_prices(ticker, days=days)
-    if not prices:
-        return {"count": 0}
 
-    # Upsert prices
-    count = 0
-    for p in prices:
-        execute("""
+def _copy_upsert_prices(conn, rows: list[tuple]) -> int:
+    """
+    Bulk-load price rows with COPY into a temp staging table, then fold
+    them into prices_daily with one upsert. Used for large backfills
+    where the CSV stream is cheaper than a giant VALUES list.
+    """
+    import csv
+    import io
+
+    buf = io.StringIO()
+    csv.writer(buf).writerows(rows)
+    buf.seek(0)
+
+    with conn.cursor() as cur:
+        cur.execute("""
+            CREATE TEMP TABLE prices_stage
+            (LIKE prices_daily INCLUDING DEFAULTS) ON COMMIT DROP
+        """)
+        cur.copy_expert("""
+            COPY prices_stage (ticker, date, open, high, low, close, adj_close, volume)
+            FROM STDIN WITH (FORMAT csv)
+        """, buf)
+        cur.execute("""
             INSERT INTO prices_daily (ticker, date, open, high, low, close, adj_close, volume)
-            VALUES (%s, %s, %s, %s, %s, %s, %s, %s)
+            SELECT ticker, date, open, high, low, close, adj_close, volume
+            FROM prices_stage
             ON CONFLICT (ticker, date) DO UPDATE SET
                 open = EXCLUDED.open,
                 high = EXCLUDED.high,
@@ -163,195 +295,180 @@ def ingest_prices(ticker: str, days: int) -> dict:
                 close = EXCLUDED.close,
                 adj_close = EXCLUDED.adj_close,
                 volume = EXCLUDED.volume
-        """, (ticker, p["date"], p["open"], p["high"], p["low"], p["close"], p["adj_close"], p["volume"]))
-        count += 1
-
-    # Compute return_1d using LAG for previous trading day
-    execute("""
-        WITH returns AS (
-            SELECT
-                ticker,
-                date,
-                (close - LAG(close) OVER (PARTITION BY ticker ORDER BY date)) /
-                    NULLIF(LAG(close) OVER (PARTITION BY ticker ORDER BY date), 0) * 100 AS return_1d
-            FROM prices_daily
-            WHERE ticker = %s
-        )
-        UPDATE prices_daily p
-        SET return_1d = r.return_1d
-        FROM returns r
-        WHERE p.ticker = r.ticker AND p.date = r.date
-    """, (ticker,))
+        """)
+        count = cur.rowcount
+    return count
+
+
+def ingest_prices(ticker: str, days: int, conn=None) -> dict:
+    """Ingest prices and compute returns."""
+    from providers.prices import fetch_daily_prices
+
+    prices = fetch_daily_prices(ticker, days=days)
+    if not prices:
+        return {"count": 0}
+
+    # Upsert all prices in one multi-row statement instead of one
+    # round-trip per day; very large backfills go through COPY
+    rows = [
+        (ticker, p["date"], p["open"], p["high"], p["low"], p["close"], p["adj_close"], p["volume"])
+        for p in prices
+    ]
+    if len(rows) >= COPY_THRESHOLD:
+        if conn is None:
+            with transaction() as own_conn:
+                count = _copy_upsert_prices(own_conn, rows)
+        else:
+            count = _copy_upsert_prices(conn, rows)
+    else:
+        count = execute_values(_UPSERT_PRICES_SQL, rows, conn=conn)
+
+    # Compute return_1d using LAG for previous trading day, touching
+    # only the rows we just ingested (with a week's lookback so the
+    # first row still sees its previous trading day) instead of
+    # rewriting the ticker's whole history every run
+    min_date = min(p["date"] for p in prices)
+    execute(_UPDATE_RETURNS_SQL, (ticker, min_date, min_date), conn=conn)
 
     return {"count": count}
 
 
-def compute_daily_agg(ticker: str, days: int) -> dict:
+def compute_daily_agg(ticker: str, days: int, conn=None) -> dict:
     """Compute daily aggregates from scored items."""
     from datetime import date, timedelta
 
     cutoff_date = date.today() - timedelta(days=days)
 
-    # Get aggregates grouped by day
-    rows = fetch_all("""
-        SELECT
-            DATE(i.published_at) as date,
-            AVG(s.sentiment_score) as sentiment_avg,
-            COUNT(*) as article_count,
-            SUM(CASE WHEN s.sentiment_label = 'POSITIVE' THEN 1 ELSE 0 END) as positive_count,
-            SUM(CASE WHEN s.sentiment_label = 'NEUTRAL' THEN 1 ELSE 0 END) as neutral_count,
-            SUM(CASE WHEN s.sentiment_label = 'NEGATIVE' THEN 1 ELSE 0 END) as negative_count
-        FROM items i
-        JOIN item_scores s ON i.id = s.item_id
-        WHERE i.ticker = %s AND DATE(i.published_at) >= %s
-        GROUP BY DATE(i.published_at)
-        ORDER BY date
-    """, (ticker, cutoff_date))
-
-    if not rows:
-        return {"count": 0}
-
-    # Upsert each day
-    count = 0
-    for row in rows:
-        execute("""
-            INSERT INTO daily_agg (ticker, date, sentiment_avg, article_count,
-                                   positive_count, neutral_count, negative_count)
-            VALUES (%s, %s, %s, %s, %s, %s, %s)
-            ON CONFLICT (ticker, date) DO UPDATE SET
-                sentiment_avg = EXCLUDED.sentiment_avg,
-                article_count = EXCLUDED.article_count,
-                positive_count = EXCLUDED.positive_count,
-                neutral_count = EXCLUDED.neutral_count,
-                negative_count = EXCLUDED.negative_count
-        """, (
-            ticker,
-            row["date"],
-            float(row["sentiment_avg"]) if row["sentiment_avg"] else 0,
-            row["article_count"],
-            row["positive_count"],
-            row["neutral_count"],
-            row["negative_count"],
-        ))
-        count += 1
+    # Aggregate and upsert entirely inside Postgres: the grouped rows
+    # never need to visit Python just to be re-inserted
+    count = execute(_UPSERT_DAILY_AGG_SQL, (ticker, cutoff_date), conn=conn)
 
     return {"count": count}
 
 
-def compute_metrics_windowed(ticker: str, window_days: int, days: int) -> dict:
+def compute_metrics_windowed(ticker: str, window_days: int, days: int, conn=None) -> dict:
     """Compute rolling window metrics."""
     import numpy as np
     from datetime import date, timedelta
 
     cutoff_date = date.today() - timedelta(days=days)
 
-    # Get daily_agg data
-    sentiments = fetch_all("""
-        SELECT date, sentiment_avg
-        FROM daily_agg
-        WHERE ticker = %s AND date >= %s
-        ORDER BY date
-    """, (ticker, cutoff_date))
-
-    # Get prices with returns
-    prices = fetch_all("""
-        SELECT date, return_1d
-        FROM prices_daily
-        WHERE ticker = %s AND return_1d IS NOT NULL AND date >= %s
-        ORDER BY date
-    """, (ticker, cutoff_date))
-
-    if not sentiments or not prices:
-        return {"count": 0}
-
-    # Build lookup dicts
-    sentiment_by_date = {str(s["date"]): s["sentiment_avg"] for s in sentiments}
-    return_by_date = {str(p["date"]): p["return_1d"] for p in prices}
+    # Let Postgres do the date alignment: one joined query instead of
+    # two SELECTs merged in Python
+    rows = fetch_all(_SELECT_JOINED_SERIES_SQL, (ticker, cutoff_date), conn=conn)
 
-    # Get all dates we have both sentiment and returns
-    common_dates = sorted(set(sentiment_by_date.keys()) & set(return_by_date.keys()))
-
-    if len(common_dates) < window_days:
+    if len(rows) < window_days:
         return {"count": 0}
 
-    count = 0
-    for i in range(window_days - 1, len(common_dates)):
-        window_dates = common_dates[i - window_days + 1 : i + 1]
-        date_end = window_dates[-1]
-
-        sentiments_window = [sentiment_by_date[d] for d in window_dates]
-        returns_window = [return_by_date[d] for d in window_dates]
-
-        # Compute metrics
-        metrics = _compute_window_metrics(sentiments_window, returns_window)
-
-        # Upsert
-        execute("""
-            INSERT INTO metrics_windowed
-                (ticker, date_end, window_days, corr, directional_match,
-                 alignment_score, misalignment_days, interpretation)
-            VALUES (%s, %s, %s, %s, %s, %s, %s, %s)
-            ON CONFLICT (ticker, date_end, window_days) DO UPDATE SET
-                corr = EXCLUDED.corr,
-                directional_match = EXCLUDED.directional_match,
-                alignment_score = EXCLUDED.alignment_score,
-                misalignment_days = EXCLUDED.misalignment_days,
-                interpretation = EXCLUDED.interpretation
-        """, (
-            ticker,
-            date_end,
-            window_days,
-            metrics["corr"],
-            metrics["directional_match"],
-            metrics["alignment_score"],
-            metrics["misalignment_days"],
-            metrics["interpretation"],
-        ))
-        count += 1
+    common_dates = [str(r["date"]) for r in rows]
+    s_vals = [float(r["sentiment_avg"]) for r in rows]
+    r_vals = [float(r["return_1d"]) for r in rows]
+
+    # Steady-state runs only recompute windows whose inputs can still
+    # move, plus anything newer than the last stored end date. Recent
+    # daily_agg rows are rewritten on every run as articles arrive, so
+    # windows ending in the last _METRICS_REFRESH_TAIL_DAYS are always
+    # refreshed (today's window keeps updating through the day); older
+    # windows are settled and are skipped. A full recompute still
+    # happens whenever the table is empty.
+    last_row = fetch_all(_SELECT_LAST_WINDOW_SQL, (ticker, window_days), conn=conn)
+    last_end = last_row[0]["last_end"] if last_row else None
+    if last_end is not None:
+        from bisect import bisect_left
+        refresh_floor = min(
+            str(last_end),
+            str(date.today() - timedelta(days=_METRICS_REFRESH_TAIL_DAYS)),
+        )
+        first_new = bisect_left(common_dates, refresh_floor)
+        if first_new >= len(common_dates):
+            return {"count": 0}
+        start = max(0, first_new - (window_days - 1))
+        common_dates = common_dates[start:]
+        s_vals = s_vals[start:]
+        r_vals = r_vals[start:]
+        if len(common_dates) < window_days:
+            return {"count": 0}
+
+    # Compute all windows at once, then upsert them in one statement
+    x = np.array(s_vals, dtype=float)
+    y = np.array(r_vals, dtype=float)
+    all_metrics = _compute_window_metrics_batch(x, y, window_days)
+
+    metric_rows = [(
+        ticker,
+        common_dates[i + window_days - 1],
+        window_days,
+        metrics["corr"],
+        metrics["directional_match"],
+        metrics["alignment_score"],
+        metrics["misalignment_days"],
+        metrics["interpretation"],
+    ) for i, metrics in enumerate(all_metrics)]
+
+    count = execute_values(_UPSERT_METRICS_SQL, metric_rows, conn=conn)
 
     return {"count": count}
 
 
-def _compute_window_metrics(sentiments: list, returns: list) -> dict:
-    """Compute metrics for a single window."""
-    import numpy as np
-
-    sentiments = np.array(sentiments, dtype=float)
-    returns = np.array(returns, dtype=float)
+def _compute_window_metrics_batch(x: "np.ndarray", y: "np.ndarray", window_days: int) -> list[dict]:
+    """
+    Compute metrics for every rolling window over aligned sentiment (x)
+    and return (y) series, one dict per window end, oldest first.
 
-    # Correlation
-    if np.std(sentiments) < 0.001 or np.std(returns) < 0.001:
-        corr = 0.0
-    else:
-        corr = float(np.corrcoef(sentiments, returns)[0, 1])
-        if np.isnan(corr):
-            corr = 0.0
-
-    # Directional match
-    sent_signs = np.sign(sentiments)
-    ret_signs = np.sign(returns)
-    matches = np.sum(sent_signs == ret_signs)
-    directional_match = float(matches / len(sentiments))
-
-    # Misalignment days
-    misalignment_days = int(len(sentiments) - matches)
-
-    # Alignment score
-    alignment_score = 0.5 * corr + 0.5 * (directional_match * 2 - 1)
-    alignment_score = max(-1.0, min(1.0, alignment_score))
-
-    # Interpretation
-    if alignment_score >= 0.3:
-        interpretation = "Aligned"
-    elif alignment_score <= -0.3:
-        interpretation = "Misleading"
-    else:
-        interpretation = "Noisy"
+    Uses prefix sums of x, y, x**2, y**2, x*y and the sign-match flags,
+    so each window's mean/variance/covariance/match-count is a pair of
+    array lookups instead of a fresh scan - O(N) total rather than
+    O(N * window_days) with a np.corrcoef call per window.
+    """
+    import numpy as np
 
-    return {
-        "corr": float(round(corr, 4)),
-        "directional_match": float(round(directional_match, 4)),
-        "alignment_score": float(round(alignment_score, 4)),
-        "misalignment_days": int(misalignment_days),
-        "interpretation": interpretation,
-    }
+    w = window_days
+
+    def _window_sums(values: "np.ndarray") -> "np.ndarray":
+        cs = np.concatenate(([0.0], np.cumsum(values)))
+        return cs[w:] - cs[:-w]
+
+    sum_x = _window_sums(x)
+    sum_y = _window_sums(y)
+    sum_x2 = _window_sums(x * x)
+    sum_y2 = _window_sums(y * y)
+    sum_xy = _window_sums(x * y)
+    matches = _window_sums((np.sign(x) == np.sign(y)).astype(float))
+
+    mean_x = sum_x / w
+    mean_y = sum_y / w
+    var_x = np.maximum(sum_x2 / w - mean_x * mean_x, 0.0)
+    var_y = np.maximum(sum_y2 / w - mean_y * mean_y, 0.0)
+    cov = sum_xy / w - mean_x * mean_y
+
+    # Same degenerate-window guard as np.std(...) < 0.001 per window
+    std_x = np.sqrt(var_x)
+    std_y = np.sqrt(var_y)
+    den = std_x * std_y
+    with np.errstate(divide="ignore", invalid="ignore"):
+        corr = np.where((std_x < 0.001) | (std_y < 0.001), 0.0, cov / den)
+    corr = np.nan_to_num(corr)
+
+    directional_match = matches / w
+    misalignment_days = w - matches
+    alignment_score = np.clip(0.5 * corr + 0.5 * (directional_match * 2 - 1), -1.0, 1.0)
+
+    results = []
+    for i in range(len(corr)):
+        score = alignment_score[i]
+        if score >= 0.3:
+            interpretation = "Aligned"
+        elif score <= -0.3:
+            interpretation = "Misleading"
+        else:
+            interpretation = "Noisy"
+
+        results.append({
+            "corr": float(round(corr[i], 4)),
+            "directional_match": float(round(directional_match[i], 4)),
+            "alignment_score": float(round(score, 4)),
+            "misalignment_days": int(misalignment_days[i]),
+            "interpretation": interpretation,
+        })
+
+    return results
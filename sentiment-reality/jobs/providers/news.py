@@ -1,26 +1,127 @@
-"""Fetch news headlines - minimal stub for hackathon."""
-from datetime import datetime, timedelta
+"""Fetch news headlines from Google News RSS (mock fallback for demos)."""
+import calendar
+from datetime import datetime, timedelta, timezone
+from email.utils import parsedate_to_datetime
 import random
+import feedparser
+import requests
+
+try:
+    from lxml import etree
+except ImportError:  # pragma: no cover - lxml is in requirements.txt
+    etree = None
+
+GOOGLE_NEWS_RSS = "https://news.google.com/rss/search?q={ticker}+stock&hl=en-US&gl=US&ceid=US:en"
+
+# Shared keep-alive session: fetching feeds for many tickers in one run
+# reuses the TCP+TLS connection, and gzip keeps the RSS payloads small
+_SESSION = requests.Session()
+_SESSION.headers['Accept-Encoding'] = 'gzip'
+
 
 def fetch_headlines(ticker: str, days: int = 7, since_ts: datetime = None) -> list[dict]:
     """
-    Fetch news headlines for a ticker.
+    Fetch news headlines for a ticker from Google News RSS.
 
-    For hackathon: returns mock data. In production, use:
-    - NewsAPI
-    - GDELT
-    - RSS feeds (Yahoo Finance, Reuters, etc.)
+    Uses feedparser's structured entry fields (title, link, source,
+    published_parsed) rather than scraping the XML by hand. Falls back
+    to mock headlines when the feed is unreachable or empty so demos
+    keep working offline.
 
     Returns list of dicts with: source, source_id, published_at, title, url, snippet
     """
-    # TODO: Implement real news fetching
-    # For now, generate mock headlines for demo
-
     if since_ts is None:
         since_ts = datetime.now() - timedelta(days=days)
 
-    mock_headlines = _generate_mock_headlines(ticker, days)
-    return mock_headlines
+    try:
+        # Fetch the feed bytes ourselves (session reuse + gzip) and hand
+        # them to a parser instead of letting feedparser open its own
+        # connection
+        resp = _SESSION.get(GOOGLE_NEWS_RSS.format(ticker=ticker), timeout=10)
+        resp.raise_for_status()
+
+        # Google News serves well-formed RSS 2.0, so the libxml2-backed
+        # lxml parser handles it at a fraction of feedparser's CPU cost;
+        # feedparser stays as the tolerant fallback for anything odd
+        entries = []
+        if etree is not None:
+            try:
+                entries = _parse_entries_lxml(resp.content)
+            except etree.XMLSyntaxError:
+                entries = []
+        if not entries:
+            entries = _parse_entries_feedparser(resp.content)
+
+        # Filter on plain epoch-seconds ints; datetimes are only built
+        # for the entries that survive the cutoff
+        since_epoch = since_ts.timestamp()
+
+        results = []
+        for entry in entries:
+            published_ts = entry["published_ts"]
+            if published_ts and published_ts < since_epoch:
+                continue
+
+            published_at = (
+                datetime.fromtimestamp(published_ts, timezone.utc).isoformat()
+                if published_ts else None
+            )
+            results.append({
+                "source": entry["source"],
+                "source_id": entry["source_id"],
+                "published_at": published_at,
+                "title": entry["title"],
+                "url": entry["url"],
+                "snippet": entry["snippet"],
+            })
+
+        if results:
+            return results
+        print(f"No RSS headlines for {ticker}, falling back to mock data")
+    except Exception as e:
+        print(f"Error fetching RSS headlines for {ticker}: {e}")
+
+    return _generate_mock_headlines(ticker, days)
+
+
+def _parse_entries_lxml(content: bytes) -> list[dict]:
+    """Stream-parse RSS 2.0 items with lxml. Raises XMLSyntaxError on bad XML."""
+    entries = []
+    for item in etree.fromstring(content).iter("item"):
+        pub = item.findtext("pubDate")
+        published_ts = None
+        if pub:
+            try:
+                published_ts = parsedate_to_datetime(pub).timestamp()
+            except (TypeError, ValueError):
+                pass
+
+        source = item.find("source")
+        entries.append({
+            "source": (source.text if source is not None else None) or "Google News",
+            "source_id": item.findtext("guid"),
+            "published_ts": published_ts,
+            "title": item.findtext("title") or "",
+            "url": item.findtext("link") or "",
+            "snippet": item.findtext("description") or "",
+        })
+    return entries
+
+
+def _parse_entries_feedparser(content: bytes) -> list[dict]:
+    """Parse feed bytes with feedparser (tolerant of malformed feeds)."""
+    entries = []
+    for entry in feedparser.parse(content).entries:
+        published = entry.get("published_parsed")
+        entries.append({
+            "source": entry.get("source", {}).get("title") or "Google News",
+            "source_id": entry.get("id"),
+            "published_ts": calendar.timegm(published) if published else None,
+            "title": entry.get("title", ""),
+            "url": entry.get("link", ""),
+            "snippet": entry.get("summary", ""),
+        })
+    return entries
 
 
 def _generate_mock_headlines(ticker: str, days: int) -> list[dict]:
@@ -1,7 +1,22 @@
 """Fetch daily prices using yfinance."""
+from functools import lru_cache
+import requests
+from requests.adapters import HTTPAdapter
 import yfinance as yf
 from datetime import datetime, timedelta
 
+# One keep-alive session shared by every Ticker: repeated fetches in a
+# multi-ticker run reuse connections instead of re-handshaking TLS
+_YF_SESSION = requests.Session()
+_YF_SESSION.mount("https://", HTTPAdapter(pool_connections=16, pool_maxsize=16, max_retries=3))
+
+
+@lru_cache(maxsize=256)
+def _ticker(symbol: str) -> yf.Ticker:
+    """Get a yf.Ticker on the shared session, one object per symbol."""
+    return yf.Ticker(symbol, session=_YF_SESSION)
+
+
 def fetch_daily_prices(ticker: str, days: int = 90) -> list[dict]:
     """
     Fetch daily price data for a ticker using yfinance.
@@ -12,7 +27,7 @@ def fetch_daily_prices(ticker: str, days: int = 90) -> list[dict]:
     start_date = end_date - timedelta(days=days + 5)  # Buffer for weekends/holidays
 
     try:
-        stock = yf.Ticker(ticker)
+        stock = _ticker(ticker)
         df = stock.history(start=start_date.strftime("%Y-%m-%d"), end=end_date.strftime("%Y-%m-%d"))
 
         if df.empty:
@@ -50,7 +50,7 @@ DEFAULT_TICKERS = ["TSLA", "NVDA", "JPM", "PFE", "GME"]
 def run_daily():
     """Run DAILY_UPDATE_ALL logic - process all active tickers."""
     from db import fetch_all, is_configured
-    from pipeline import run_pipeline_for_ticker
+    from pipeline import run_pipeline_for_tickers
 
     if not is_configured():
         print("ERROR: Database not configured. Set DATABASE_URL in .env")
@@ -73,18 +73,14 @@ def run_daily():
 
     print(f"\nActive tickers: {[t['ticker'] for t in tickers]}")
 
-    results = {}
-    for row in tickers:
-        ticker = row["ticker"]
-        try:
-            result = run_pipeline_for_ticker(
-                ticker=ticker,
-                **DAILY_PARAMS,
-            )
-            results[ticker] = result["success"]
-        except Exception as e:
-            print(f"\nError processing {ticker}: {e}")
-            results[ticker] = False
+    # Pipelines are independent and mostly wait on network I/O;
+    # run_pipeline_for_tickers fans them out on a thread pool and
+    # returns one summary per ticker, in input order
+    ticker_names = [row["ticker"] for row in tickers]
+    summaries = run_pipeline_for_tickers(ticker_names, **DAILY_PARAMS)
+    results = {
+        t: s.get("success", False) for t, s in zip(ticker_names, summaries)
+    }
 
     # Summary
     print("\n" + "=" * 60)
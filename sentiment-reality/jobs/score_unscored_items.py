@@ -5,7 +5,7 @@ This queries the DB for items that don't have a score for model='hf_fin_v1',
 fetches the full article text, runs sentiment scoring, and writes results.
 """
 from db import fetch_all, execute, is_configured
-from ingest_news import get_article_text
+from ingest_news import get_article_texts
 from ml.sentiment import score_text
 
 
@@ -59,6 +59,10 @@ def score_unscored_items(ticker: str, limit: int = 25) -> dict:
 
     print(f"Found {len(unscored)} unscored items")
 
+    # Fetch all article texts up front with a thread pool; the downloads
+    # are network-bound while scoring below is CPU/model-bound
+    texts_by_url = get_article_texts([item["url"] for item in unscored])
+
     for i, item in enumerate(unscored):
         item_id = item["id"]
         url = item["url"]
@@ -68,8 +72,8 @@ def score_unscored_items(ticker: str, limit: int = 25) -> dict:
         print(f"  [{i + 1}/{len(unscored)}] {title[:50]}...")
 
         try:
-            # Try to get full article text
-            text = get_article_text(url)
+            # Full article text from the prefetch above
+            text = texts_by_url.get(url, "")
 
             # Fallback to title + snippet if extraction fails
             if not text or not text.strip():
@@ -7,57 +7,72 @@ and stores them in the current_prices table.
 import sys
 from datetime import datetime, timezone
 import yfinance as yf
-from db import query, execute
+from db import query, execute, execute_values
+
+UPSERT_CURRENT_PRICES_SQL = """
+    INSERT INTO current_prices
+    (ticker, current_price, price_change, price_direction, price_timestamp)
+    VALUES %s
+    ON CONFLICT (ticker) DO UPDATE SET
+        current_price = EXCLUDED.current_price,
+        price_change = EXCLUDED.price_change,
+        price_direction = EXCLUDED.price_direction,
+        price_timestamp = EXCLUDED.price_timestamp,
+        updated_at = now()
+"""
 
 
-def get_current_price(ticker: str) -> dict:
+def get_current_prices(tickers: list[str]) -> dict:
     """
-    Fetch current stock price and related data.
-    
-    Args:
-        ticker: Stock ticker symbol
-    
+    Fetch current and previous closes for all tickers in one parallel
+    yf.download call instead of a serial .info scrape per ticker.
+
     Returns:
-        Dict with price, price_change, and price_direction
+        Dict mapping ticker -> {price, price_change, price_direction}
+        ({'price': None, ...} where no data came back)
     """
+    no_data = {'price': None, 'price_change': None, 'price_direction': 'unknown'}
+    results = {t: dict(no_data) for t in tickers}
+
     try:
-        ticker_obj = yf.Ticker(ticker)
-        info = ticker_obj.info
-        
-        current_price = info.get('currentPrice') or info.get('regularMarketPrice')
-        previous_close = info.get('previousClose')
-        
-        if not current_price:
-            return {
-                'price': None,
-                'price_change': None,
-                'price_direction': 'unknown'
-            }
-        
-        # Calculate price change
-        price_change = None
-        price_direction = 'neutral'
-        
-        if previous_close:
-            price_change = round(current_price - previous_close, 2)
-            if price_change > 0:
-                price_direction = 'up'
-            elif price_change < 0:
-                price_direction = 'down'
-        
-        return {
-            'price': round(current_price, 2),
-            'price_change': price_change,
-            'price_direction': price_direction
-        }
-    
+        df = yf.download(
+            tickers=" ".join(tickers),
+            period="2d",
+            interval="1d",
+            group_by="ticker",
+            threads=True,
+            progress=False,
+        )
     except Exception as e:
-        print(f"  Error fetching current price for {ticker}: {e}")
-        return {
-            'price': None,
-            'price_change': None,
-            'price_direction': 'unknown'
-        }
+        print(f"  Error fetching current prices: {e}")
+        return results
+
+    for ticker in tickers:
+        try:
+            closes = (df[ticker]['Close'] if len(tickers) > 1 else df['Close']).dropna()
+            if closes.empty:
+                continue
+
+            current_price = round(float(closes.iloc[-1]), 2)
+            price_change = None
+            price_direction = 'neutral'
+
+            if len(closes) > 1:
+                price_change = round(current_price - float(closes.iloc[-2]), 2)
+                if price_change > 0:
+                    price_direction = 'up'
+                elif price_change < 0:
+                    price_direction = 'down'
+
+            results[ticker] = {
+                'price': current_price,
+                'price_change': price_change,
+                'price_direction': price_direction,
+            }
+        except Exception as e:
+            print(f"  Error reading price data for {ticker}: {e}")
+
+    return results
 
 
 def update_current_prices():
@@ -80,48 +95,38 @@ def update_current_prices():
         updated = 0
         errors = 0
         timestamp = datetime.now(timezone.utc).isoformat()
-        
+
         print(f"Found {total} tracked stocks\n")
-        
-        for i, stock in enumerate(stocks, 1):
-            ticker = stock['ticker']
-            
-            # Fetch current price
-            price_data = get_current_price(ticker)
-            
+
+        # One parallel fetch for every ticker, then one batched upsert
+        tickers = [stock['ticker'] for stock in stocks]
+        prices = get_current_prices(tickers)
+
+        rows = []
+        for i, ticker in enumerate(tickers, 1):
+            price_data = prices[ticker]
+
             if price_data['price'] is None:
                 errors += 1
                 print(f"  [{i}/{total}] ❌ ERROR: No price data for {ticker}")
                 continue
-            
-            try:
-                # Insert or update current price
-                execute("""
-                    INSERT INTO current_prices 
-                    (ticker, current_price, price_change, price_direction, price_timestamp)
-                    VALUES (%s, %s, %s, %s, %s)
-                    ON CONFLICT (ticker) DO UPDATE SET
-                        current_price = EXCLUDED.current_price,
-                        price_change = EXCLUDED.price_change,
-                        price_direction = EXCLUDED.price_direction,
-                        price_timestamp = EXCLUDED.price_timestamp,
-                        updated_at = now()
-                """, (
-                    ticker,
-                    price_data['price'],
-                    price_data['price_change'],
-                    price_data['price_direction'],
-                    timestamp
-                ))
-                
-                updated += 1
-                direction_symbol = "📈" if price_data['price_direction'] == 'up' else "📉" if price_data['price_direction'] == 'down' else "→"
-                print(f"  [{i}/{total}] ✓ {ticker}: ${price_data['price']} {direction_symbol} ({price_data['price_change']})")
-            
-            except Exception as e:
-                errors += 1
-                print(f"  [{i}/{total}] ❌ ERROR updating {ticker}: {str(e)[:100]}")
-        
+
+            rows.append((
+                ticker,
+                price_data['price'],
+                price_data['price_change'],
+                price_data['price_direction'],
+                timestamp
+            ))
+            direction_symbol = "📈" if price_data['price_direction'] == 'up' else "📉" if price_data['price_direction'] == 'down' else "→"
+            print(f"  [{i}/{total}] ✓ {ticker}: ${price_data['price']} {direction_symbol} ({price_data['price_change']})")
+
+        try:
+            updated = execute_values(UPSERT_CURRENT_PRICES_SQL, rows)
+        except Exception as e:
+            errors += len(rows)
+            print(f"  ❌ ERROR upserting current prices: {str(e)[:100]}")
+
         result = {
             'total': total,
             'updated': updated,
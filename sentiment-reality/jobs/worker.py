@@ -9,13 +9,31 @@ Task types:
 
 Safe claiming uses FOR UPDATE SKIP LOCKED to prevent double-processing.
 """
+import os
 import time
 import json
-from db import fetch_all, execute, get_connection
-from pipeline import run_pipeline_for_ticker
-from alignment import insert_alignment_result
+import random
+import select
+import logging
+
+# orjson serializes result payloads several times faster than stdlib
+# json; fall back silently since the output is interchangeable here.
+try:
+    import orjson
+except ImportError:
+    orjson = None
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from db import fetch_iter, execute, get_conn, get_connection
 from datetime import datetime
 
+# pipeline/alignment pull in the heavy ML and data stack (transformers,
+# torch, pandas, yfinance), so handlers import them on first use - an
+# idle polling worker stays small and starts fast.
+
+logging.basicConfig(level=logging.INFO, format="%(asctime)s %(levelname)s %(message)s")
+logger = logging.getLogger("worker")
+
 # Default parameters for each task type
 DAILY_PARAMS = {
     "news_hours": 48,
@@ -48,76 +66,161 @@ DEFAULT_TICKERS = ["TSLA", "NVDA", "JPM", "PFE", "GME"]
 
 MAX_ATTEMPTS = 3
 
+# How many tasks to claim per round-trip. Claims are queued in-process
+# and run sequentially, so one claim query amortizes over the batch.
+WORKER_BATCH_SIZE = int(os.environ.get("WORKER_BATCH_SIZE", "8"))
+
+# Tasks claimed but not yet processed (filled by run_once in batches)
+_claimed_tasks = deque()
+
+# The active-ticker list changes rarely, so cache it briefly: repeated
+# DAILY_UPDATE_ALL runs in the same worker skip the repeat query.
+_TICKERS_TTL_SECONDS = 60
+_tickers_cache = {"expires": 0.0, "rows": None}
+
+
+def _get_active_tickers() -> list[dict]:
+    """Fetch active tickers, cached for _TICKERS_TTL_SECONDS."""
+    now = time.monotonic()
+    if _tickers_cache["rows"] is None or now >= _tickers_cache["expires"]:
+        # Server-side cursor streams the scan in pages, so a refill
+        # never buffers the whole watchlist twice (server + client).
+        _tickers_cache["rows"] = list(fetch_iter(
+            "SELECT ticker FROM tracked_stocks WHERE is_active = true ORDER BY ticker"
+        ))
+        _tickers_cache["expires"] = now + _TICKERS_TTL_SECONDS
+    return _tickers_cache["rows"]
+
+
+# Claim strategy: 'skip_locked' (default) uses FOR UPDATE SKIP LOCKED,
+# the fast path on plain Postgres. 'update' is a single atomic UPDATE
+# with a subselect - no row locks held across the CTE - for deployments
+# where SKIP LOCKED behaves poorly (pgbouncer transaction pooling,
+# distributed Postgres).
+CLAIM_STRATEGY = os.environ.get("CLAIM_STRATEGY", "skip_locked")
+
+CLAIM_SKIP_LOCKED_SQL = """
+    WITH next AS (
+        SELECT id
+        FROM tasks
+        WHERE status = 'PENDING' AND scheduled_at <= now()
+        ORDER BY priority DESC, created_at ASC
+        FOR UPDATE SKIP LOCKED
+        LIMIT %s
+    )
+    UPDATE tasks t
+    SET status = 'RUNNING', updated_at = now()
+    FROM next
+    WHERE t.id = next.id
+    RETURNING t.id, t.task_type, t.ticker, t.payload, t.attempts
+"""
 
-def claim_next_task() -> dict | None:
+# The status recheck in the outer WHERE makes concurrent claims safe:
+# if another worker wins the race, the re-evaluated row is no longer
+# PENDING and drops out of this UPDATE.
+CLAIM_UPDATE_SQL = """
+    UPDATE tasks t
+    SET status = 'RUNNING', updated_at = now()
+    WHERE t.status = 'PENDING'
+      AND t.id IN (
+        SELECT id
+        FROM tasks
+        WHERE status = 'PENDING' AND scheduled_at <= now()
+        ORDER BY priority DESC, created_at ASC
+        LIMIT %s
+    )
+    RETURNING t.id, t.task_type, t.ticker, t.payload, t.attempts
+"""
+
+
+def claim_next_tasks(limit: int) -> list[dict]:
     """
-    Claim the next pending task using FOR UPDATE SKIP LOCKED.
-    Returns task dict or None if no tasks available.
+    Claim up to `limit` pending tasks atomically.
+    Returns a list of task dicts (may be empty).
 
-    Uses atomic CTE to claim in a single query.
+    The whole batch is claimed in a single query (strategy chosen by
+    CLAIM_STRATEGY); crashed workers are safe because claimed rows go
+    RUNNING and the stale-lease cleanup can requeue them.
     """
+    claim_sql = CLAIM_UPDATE_SQL if CLAIM_STRATEGY == "update" else CLAIM_SKIP_LOCKED_SQL
     with get_connection() as conn:
         with conn.cursor() as cur:
-            # Atomic claim using CTE
-            cur.execute("""
-                WITH next AS (
-                    SELECT id
-                    FROM tasks
-                    WHERE status = 'PENDING'
-                    ORDER BY priority DESC, created_at ASC
-                    FOR UPDATE SKIP LOCKED
-                    LIMIT 1
-                )
-                UPDATE tasks t
-                SET status = 'RUNNING', attempts = attempts + 1, updated_at = now()
-                FROM next
-                WHERE t.id = next.id
-                RETURNING t.id, t.task_type, t.ticker, t.payload, t.attempts
-            """)
-            row = cur.fetchone()
+            cur.execute(claim_sql, (limit,))
+            rows = cur.fetchall()
             conn.commit()
 
-            if not row:
-                return None
+            return [
+                {
+                    "id": str(task_id),
+                    "task_type": task_type,
+                    "ticker": ticker,
+                    "payload": payload or {},
+                    "attempts": attempts,
+                }
+                for task_id, task_type, ticker, payload, attempts in rows
+            ]
+
+
+def claim_next_task() -> dict | None:
+    """Claim a single pending task, or None if no tasks available."""
+    tasks = claim_next_tasks(1)
+    return tasks[0] if tasks else None
+
+
+# One UPDATE covers all three completion outcomes (error / result /
+# no-result): NULL params leave error and payload untouched, so the
+# statement text is stable and plan-cacheable instead of three variants.
+COMPLETE_SQL = """
+    UPDATE tasks
+    SET status = %s,
+        error = COALESCE(%s, error),
+        payload = CASE
+            WHEN %s::jsonb IS NULL THEN payload
+            ELSE COALESCE(payload, '{}'::jsonb) || %s::jsonb
+        END,
+        updated_at = now()
+    WHERE id = %s
+"""
+
+
+# Requeue a retryable failure: back to PENDING with an exponential
+# backoff encoded in scheduled_at, which the claim SQL respects.
+# attempts counts *failed* attempts and is bumped here rather than in
+# the claim UPDATE, so the first-try-success common case writes fewer
+# bytes per claim (and keeps the claim row change HOT-update friendly).
+RETRY_SQL = """
+    UPDATE tasks
+    SET status = 'PENDING',
+        attempts = attempts + 1,
+        error = %s,
+        scheduled_at = now() + interval '1 minute' * %s,
+        updated_at = now()
+    WHERE id = %s
+"""
+
 
-            task_id, task_type, ticker, payload, attempts = row
+def retry_task(task_id: str, attempt_no: int, error: str):
+    """Requeue a failed task with exponential backoff (2^attempt_no minutes)."""
+    delay_minutes = 2 ** attempt_no
+    execute(RETRY_SQL, (f"Attempt {attempt_no}: {error}"[:1000], delay_minutes, task_id))
+    return delay_minutes
 
-            return {
-                "id": str(task_id),
-                "task_type": task_type,
-                "ticker": ticker,
-                "payload": payload or {},
-                "attempts": attempts,
-            }
+
+def _dumps(obj) -> str:
+    """Serialize to JSON, preferring orjson when installed."""
+    if orjson is not None:
+        return orjson.dumps(obj).decode()
+    return json.dumps(obj)
 
 
 def complete_task(task_id: str, result: dict = None, error: str = None):
     """Mark task as DONE or ERROR with optional result/error info."""
     if error:
-        execute("""
-            UPDATE tasks
-            SET status = 'ERROR',
-                error = %s,
-                updated_at = now()
-            WHERE id = %s
-        """, (error[:1000], task_id))
+        status, error_text, result_json = "ERROR", error[:1000], None
     else:
-        # Store result in payload if provided
-        if result:
-            execute("""
-                UPDATE tasks
-                SET status = 'DONE',
-                    payload = COALESCE(payload, '{}'::jsonb) || %s,
-                    updated_at = now()
-                WHERE id = %s
-            """, (json.dumps({"result": result}), task_id))
-        else:
-            execute("""
-                UPDATE tasks
-                SET status = 'DONE',
-                    updated_at = now()
-                WHERE id = %s
-            """, (task_id,))
+        status, error_text = "DONE", None
+        result_json = _dumps({"result": result}) if result else None
+    execute(COMPLETE_SQL, (status, error_text, result_json, result_json, task_id))
 
 
 def handle_daily_update_all(task: dict) -> dict:
@@ -126,28 +229,32 @@ def handle_daily_update_all(task: dict) -> dict:
 
     Does NOT enqueue separate tasks - runs pipeline directly for each ticker.
     """
-    print("\n" + "=" * 60)
-    print("DAILY_UPDATE_ALL: Processing all active tickers")
-    print("=" * 60)
+    from pipeline import run_pipeline_for_ticker
+    from alignment import insert_alignment_for_date
 
-    # Get active tickers
-    tickers = fetch_all(
-        "SELECT ticker FROM tracked_stocks WHERE is_active = true ORDER BY ticker"
-    )
+    logger.info("\n%s\nDAILY_UPDATE_ALL: Processing all active tickers\n%s", "=" * 60, "=" * 60)
+
+    # Get active tickers (cached with a short TTL)
+    tickers = _get_active_tickers()
 
     if not tickers:
-        print("No active tickers found!")
+        logger.warning("No active tickers found!")
         return {"tickers_processed": 0, "results": {}}
 
-    # Get params from payload or use defaults
+    # Get params from payload or use defaults. With no payload (the
+    # common scheduled case) the defaults are passed straight through -
+    # no merged dict and no per-key re-lookup per ticker. The explicit
+    # key selection on the override path keeps stray payload keys out
+    # of the pipeline call.
     payload = task.get("payload", {})
-    params = {**DAILY_PARAMS, **payload}
+    params = DAILY_PARAMS if not payload else {**DAILY_PARAMS, **payload}
 
-    results = {}
     today = datetime.utcnow().strftime("%Y-%m-%d")
-    for row in tickers:
-        ticker = row["ticker"]
-        try:
+
+    def process_one(ticker: str) -> dict:
+        if not payload:
+            result = run_pipeline_for_ticker(ticker=ticker, **DAILY_PARAMS)
+        else:
             result = run_pipeline_for_ticker(
                 ticker=ticker,
                 news_hours=params["news_hours"],
@@ -157,22 +264,43 @@ def handle_daily_update_all(task: dict) -> dict:
                 metrics_days=params["metrics_days"],
                 window_days=params["window_days"],
             )
-            # Insert alignment result for today
-            alignment_success = insert_alignment_result(ticker, today)
-            results[ticker] = {
-                "success": result["success"],
-                "elapsed": result["elapsed_seconds"],
-                "alignment_inserted": alignment_success,
-            }
-        except Exception as e:
-            print(f"Error processing {ticker}: {e}")
-            results[ticker] = {"success": False, "error": str(e)}
+        return {
+            "success": result["success"],
+            "elapsed": result["elapsed_seconds"],
+        }
+
+    # Tickers are independent (own news/prices fetches and upserts), so
+    # run them concurrently - wall time becomes max(t_i) per batch of
+    # workers instead of sum(t_i), mostly by overlapping network waits.
+    results = {}
+    with ThreadPoolExecutor(max_workers=min(8, len(tickers))) as executor:
+        futures = {
+            executor.submit(process_one, row["ticker"]): row["ticker"]
+            for row in tickers
+        }
+        for future in as_completed(futures):
+            ticker = futures[future]
+            try:
+                results[ticker] = future.result()
+            except Exception as e:
+                logger.error("Error processing %s: %s", ticker, e)
+                results[ticker] = {"success": False, "error": str(e)}
+
+    # One server-side statement covers today's alignment for every
+    # ticker at once, instead of a compute+upsert round-trip per ticker.
+    try:
+        alignment_rows = insert_alignment_for_date(today)
+    except Exception as e:
+        logger.error("Error inserting alignment for %s: %s", today, e)
+        alignment_rows = 0
 
-    print("\n" + "=" * 60)
-    print(f"DAILY_UPDATE_ALL COMPLETE: {len(results)} tickers processed")
-    print("=" * 60)
+    logger.info("\n%s\nDAILY_UPDATE_ALL COMPLETE: %d tickers processed\n%s", "=" * 60, len(results), "=" * 60)
 
-    return {"tickers_processed": len(results), "results": results}
+    return {
+        "tickers_processed": len(results),
+        "alignment_rows": alignment_rows,
+        "results": results,
+    }
 
 
 def handle_refresh_stock(task: dict) -> dict:
@@ -181,6 +309,8 @@ def handle_refresh_stock(task: dict) -> dict:
 
     Ticker comes from task.ticker or task.payload.ticker
     """
+    from pipeline import run_pipeline_for_ticker
+
     ticker = task.get("ticker")
     if not ticker:
         ticker = task.get("payload", {}).get("ticker")
@@ -188,27 +318,28 @@ def handle_refresh_stock(task: dict) -> dict:
     if not ticker:
         raise ValueError("No ticker specified in task")
 
-    print(f"\n{'='*60}")
-    print(f"REFRESH_STOCK: {ticker}")
-    print(f"{'='*60}")
+    logger.info("\n%s\nREFRESH_STOCK: %s\n%s", "=" * 60, ticker, "=" * 60)
 
-    # Get params from payload or use defaults
+    # No payload: pass the defaults straight through. With overrides,
+    # merge once and select the pipeline keys explicitly (the merged
+    # dict already carries every default, and stray payload keys like
+    # "ticker" must not reach the pipeline call).
     payload = task.get("payload", {})
-    params = {**REFRESH_PARAMS, **payload}
-
-    result = run_pipeline_for_ticker(
-        ticker=ticker,
-        news_hours=params.get("news_hours", REFRESH_PARAMS["news_hours"]),
-        score_limit=params.get("score_limit", REFRESH_PARAMS["score_limit"]),
-        prices_days=params.get("prices_days", REFRESH_PARAMS["prices_days"]),
-        agg_days=params.get("agg_days", REFRESH_PARAMS["agg_days"]),
-        metrics_days=params.get("metrics_days", REFRESH_PARAMS["metrics_days"]),
-        window_days=params.get("window_days", REFRESH_PARAMS["window_days"]),
-    )
-
-    print(f"\n{'='*60}")
-    print(f"REFRESH_STOCK COMPLETE: {ticker}")
-    print(f"{'='*60}")
+    if not payload:
+        result = run_pipeline_for_ticker(ticker=ticker, **REFRESH_PARAMS)
+    else:
+        params = {**REFRESH_PARAMS, **payload}
+        result = run_pipeline_for_ticker(
+            ticker=ticker,
+            news_hours=params["news_hours"],
+            score_limit=params["score_limit"],
+            prices_days=params["prices_days"],
+            agg_days=params["agg_days"],
+            metrics_days=params["metrics_days"],
+            window_days=params["window_days"],
+        )
+
+    logger.info("\n%s\nREFRESH_STOCK COMPLETE: %s\n%s", "=" * 60, ticker, "=" * 60)
 
     return result
 
@@ -220,6 +351,8 @@ def handle_backfill_stock(task: dict) -> dict:
     Uses larger limits for news_hours and score_limit, and computes
     metrics for multiple window sizes (7, 14, 30 days).
     """
+    from pipeline import run_pipeline_for_ticker
+
     ticker = task.get("ticker")
     if not ticker:
         ticker = task.get("payload", {}).get("ticker")
@@ -227,27 +360,27 @@ def handle_backfill_stock(task: dict) -> dict:
     if not ticker:
         raise ValueError("No ticker specified in task")
 
-    print(f"\n{'='*60}")
-    print(f"BACKFILL_STOCK: {ticker}")
-    print(f"{'='*60}")
+    logger.info("\n%s\nBACKFILL_STOCK: %s\n%s", "=" * 60, ticker, "=" * 60)
 
-    # Get params from payload or use backfill defaults
+    # Same fast path as REFRESH_STOCK: defaults straight through when
+    # there is no payload, one merge plus explicit key selection when
+    # there is.
     payload = task.get("payload", {})
-    params = {**BACKFILL_PARAMS, **payload}
-
-    result = run_pipeline_for_ticker(
-        ticker=ticker,
-        news_hours=params.get("news_hours", BACKFILL_PARAMS["news_hours"]),
-        score_limit=params.get("score_limit", BACKFILL_PARAMS["score_limit"]),
-        prices_days=params.get("prices_days", BACKFILL_PARAMS["prices_days"]),
-        agg_days=params.get("agg_days", BACKFILL_PARAMS["agg_days"]),
-        metrics_days=params.get("metrics_days", BACKFILL_PARAMS["metrics_days"]),
-        window_days_list=params.get("window_days_list", BACKFILL_PARAMS["window_days_list"]),
-    )
-
-    print(f"\n{'='*60}")
-    print(f"BACKFILL_STOCK COMPLETE: {ticker}")
-    print(f"{'='*60}")
+    if not payload:
+        result = run_pipeline_for_ticker(ticker=ticker, **BACKFILL_PARAMS)
+    else:
+        params = {**BACKFILL_PARAMS, **payload}
+        result = run_pipeline_for_ticker(
+            ticker=ticker,
+            news_hours=params["news_hours"],
+            score_limit=params["score_limit"],
+            prices_days=params["prices_days"],
+            agg_days=params["agg_days"],
+            metrics_days=params["metrics_days"],
+            window_days_list=params["window_days_list"],
+        )
+
+    logger.info("\n%s\nBACKFILL_STOCK COMPLETE: %s\n%s", "=" * 60, ticker, "=" * 60)
 
     return result
 
@@ -258,16 +391,20 @@ def handle_backfill_defaults(task: dict) -> dict:
 
     Runs full backfill pipeline for TSLA, NVDA, JPM, PFE, GME.
     """
-    print(f"\n{'='*60}")
-    print(f"BACKFILL_DEFAULTS: Processing {len(DEFAULT_TICKERS)} tickers")
-    print(f"  Tickers: {', '.join(DEFAULT_TICKERS)}")
-    print(f"{'='*60}")
+    from pipeline import run_pipeline_for_ticker
 
+    logger.info(
+        "\n%s\nBACKFILL_DEFAULTS: Processing %d tickers\n  Tickers: %s\n%s",
+        "=" * 60, len(DEFAULT_TICKERS), ", ".join(DEFAULT_TICKERS), "=" * 60,
+    )
+
+    # Same concurrent fan-out as DAILY_UPDATE_ALL: backfills are the
+    # longest tasks and benefit most from overlapping network waits.
     results = {}
-    for ticker in DEFAULT_TICKERS:
-        try:
-            print(f"\n--- Backfilling {ticker} ---")
-            result = run_pipeline_for_ticker(
+    with ThreadPoolExecutor(max_workers=min(4, len(DEFAULT_TICKERS))) as executor:
+        futures = {
+            executor.submit(
+                run_pipeline_for_ticker,
                 ticker=ticker,
                 news_hours=BACKFILL_PARAMS["news_hours"],
                 score_limit=BACKFILL_PARAMS["score_limit"],
@@ -275,39 +412,68 @@ def handle_backfill_defaults(task: dict) -> dict:
                 agg_days=BACKFILL_PARAMS["agg_days"],
                 metrics_days=BACKFILL_PARAMS["metrics_days"],
                 window_days_list=BACKFILL_PARAMS["window_days_list"],
-            )
-            results[ticker] = {
-                "success": result.get("success", False),
-                "elapsed": result.get("elapsed_seconds", 0),
-            }
-        except Exception as e:
-            print(f"Error backfilling {ticker}: {e}")
-            results[ticker] = {"success": False, "error": str(e)}
-
-    print(f"\n{'='*60}")
-    print(f"BACKFILL_DEFAULTS COMPLETE: {len(results)} tickers processed")
-    print(f"{'='*60}")
+            ): ticker
+            for ticker in DEFAULT_TICKERS
+        }
+        for future in as_completed(futures):
+            ticker = futures[future]
+            try:
+                result = future.result()
+                results[ticker] = {
+                    "success": result.get("success", False),
+                    "elapsed": result.get("elapsed_seconds", 0),
+                }
+            except Exception as e:
+                logger.error("Error backfilling %s: %s", ticker, e)
+                results[ticker] = {"success": False, "error": str(e)}
+
+    logger.info("\n%s\nBACKFILL_DEFAULTS COMPLETE: %d tickers processed\n%s", "=" * 60, len(results), "=" * 60)
 
     return {"tickers": DEFAULT_TICKERS, "results": results}
 
 
-def run_once() -> bool:
+def run_once(batch_size: int = 1) -> bool:
     """
     Process one task and return.
     Returns True if a task was processed, False if no tasks available.
+
+    With batch_size > 1 (run_loop passes WORKER_BATCH_SIZE), tasks are
+    claimed that many per round-trip and worked through on subsequent
+    calls, so a deep queue costs one claim query per batch instead of
+    one per task. One-shot callers (--once, worker-once) keep the
+    default of 1 - a single invocation must never exit with extra
+    claims stranded in RUNNING. Each task still completes
+    independently - a failure only affects its own row.
     """
-    task = claim_next_task()
-    if not task:
+    refilled = False
+    if not _claimed_tasks:
+        _claimed_tasks.extend(claim_next_tasks(batch_size))
+        refilled = True
+    if not _claimed_tasks:
         return False
+    task = _claimed_tasks.popleft()
+
+    # Heartbeat: tasks that sat in the deque while earlier batch members
+    # ran still carry their claim-time updated_at, so re-stamp the lease
+    # before starting. A task can still outwait the lease in the deque;
+    # a 0-row heartbeat means the reaper took it back (and another
+    # worker may be running it), so drop it instead of double-running.
+    if not refilled:
+        if execute(HEARTBEAT_SQL, (task["id"],)) == 0:
+            logger.warning(
+                "[WORKER] Task %s was reaped while queued - skipping", task["id"]
+            )
+            return True
 
     task_id = task["id"]
     task_type = task["task_type"]
-    attempts = task["attempts"]
+    # attempts column counts prior failures; this run is the next attempt
+    attempts = task["attempts"] + 1
 
-    print(f"\n[WORKER] Processing: {task_type}")
-    print(f"  Task ID: {task_id}")
-    print(f"  Ticker: {task.get('ticker', 'N/A')}")
-    print(f"  Attempt: {attempts}/{MAX_ATTEMPTS}")
+    logger.info(
+        "\n[WORKER] Processing: %s\n  Task ID: %s\n  Ticker: %s\n  Attempt: %d/%d",
+        task_type, task_id, task.get("ticker", "N/A"), attempts, MAX_ATTEMPTS,
+    )
 
     try:
         if task_type == "DAILY_UPDATE_ALL":
@@ -322,42 +488,132 @@ def run_once() -> bool:
             raise ValueError(f"Unknown task type: {task_type}")
 
         complete_task(task_id, result=result)
-        print(f"\n[WORKER] ✓ Task {task_id} completed successfully")
+        logger.info("[WORKER] ✓ Task %s completed successfully", task_id)
         return True
 
     except Exception as e:
         error_msg = str(e)
-        print(f"\n[WORKER] ✗ Task {task_id} failed: {error_msg}")
+        logger.error("[WORKER] ✗ Task %s failed: %s", task_id, error_msg)
 
         if attempts >= MAX_ATTEMPTS:
-            print(f"  Max attempts ({MAX_ATTEMPTS}) reached - marking as ERROR")
+            logger.error("Max attempts (%d) reached - marking as ERROR", MAX_ATTEMPTS)
+            execute("UPDATE tasks SET attempts = attempts + 1 WHERE id = %s", (task_id,))
             complete_task(task_id, error=error_msg)
         else:
-            # Leave as ERROR, manual retry needed
-            complete_task(task_id, error=f"Attempt {attempts}: {error_msg}")
+            delay = retry_task(task_id, attempts, error_msg)
+            logger.info("Requeued task %s for retry in %d min", task_id, delay)
 
         return True
 
 
+def _open_listen_conn():
+    """
+    Open a dedicated LISTEN connection for new-task notifications.
+    Returns None if the database is unreachable; the worker then falls
+    back to plain interval polling.
+    """
+    try:
+        conn = get_conn()
+        conn.autocommit = True
+        with conn.cursor() as cur:
+            cur.execute("LISTEN tasks_new")
+        return conn
+    except Exception as e:
+        logger.warning("[WORKER] LISTEN unavailable (%s) - using plain polling", e)
+        return None
+
+
+def _wait_for_task(listen_conn, timeout: float):
+    """
+    Block until a tasks_new notification arrives or timeout expires.
+    With no LISTEN connection this degrades to a plain sleep, so the
+    poll interval stays as the safety net either way.
+    """
+    if listen_conn is None:
+        time.sleep(timeout)
+        return
+    ready, _, _ = select.select([listen_conn], [], [], timeout)
+    if ready:
+        listen_conn.poll()
+        del listen_conn.notifies[:]
+
+
+# Ceiling for the backed-off poll interval, seconds
+MAX_POLL_INTERVAL = 120
+
+# Stale-lease reaping: a worker that crashes mid-task leaves its row
+# RUNNING forever, so the loop periodically requeues RUNNING tasks with
+# an old updated_at. The lease must comfortably exceed the longest
+# normal task (a full BACKFILL_DEFAULTS) or live tasks get requeued and
+# run twice.
+LEASE_MINUTES = 30
+REAP_INTERVAL_SECONDS = 300
+
+REAP_STALE_SQL = """
+    UPDATE tasks
+    SET status = 'PENDING', updated_at = now()
+    WHERE status = 'RUNNING'
+      AND updated_at < now() - interval '1 minute' * %s
+"""
+
+# Lease renewal for a task about to start after waiting in the local
+# batch queue. The status guard makes the rowcount meaningful: 0 rows
+# means the reaper already requeued the task (it outwaited the lease in
+# the deque) and another worker may own it now, so the caller must drop
+# it rather than run it.
+HEARTBEAT_SQL = """
+    UPDATE tasks
+    SET updated_at = now()
+    WHERE id = %s AND status = 'RUNNING'
+"""
+
+
+def reap_stale_tasks() -> int:
+    """Requeue RUNNING tasks abandoned by crashed workers."""
+    return execute(REAP_STALE_SQL, (LEASE_MINUTES,))
+
+
 def run_loop(poll_interval: int = 10):
-    """Continuously poll for tasks."""
-    print("=" * 60)
-    print("WORKER: Starting task loop")
-    print(f"  Poll interval: {poll_interval}s")
-    print("  Press Ctrl+C to stop")
-    print("=" * 60)
+    """Continuously poll for tasks, woken early by LISTEN/NOTIFY."""
+    logger.info(
+        "%s\nWORKER: Starting task loop\n  Poll interval: %ds\n  Press Ctrl+C to stop\n%s",
+        "=" * 60, poll_interval, "=" * 60,
+    )
+
+    listen_conn = _open_listen_conn()
+
+    # Empty polls back off with decorrelated jitter (AWS-style:
+    # next = uniform(base, cur * 3), capped) so an idle fleet neither
+    # hammers the table nor wakes in lockstep after a shared outage.
+    # A NOTIFY still wakes the worker immediately, and any real task
+    # resets the interval to the base.
+    wait = poll_interval
+    last_reap = 0.0
 
     while True:
         try:
-            if not run_once():
-                print(f"[WORKER] No tasks, sleeping {poll_interval}s...")
-                time.sleep(poll_interval)
+            now = time.monotonic()
+            if now - last_reap >= REAP_INTERVAL_SECONDS:
+                reaped = reap_stale_tasks()
+                if reaped:
+                    logger.warning("[WORKER] Requeued %d stale RUNNING task(s)", reaped)
+                last_reap = now
+
+            if run_once(WORKER_BATCH_SIZE):
+                wait = poll_interval
+            else:
+                logger.info("[WORKER] No tasks, waiting up to %.0fs...", wait)
+                _wait_for_task(listen_conn, wait)
+                wait = min(MAX_POLL_INTERVAL, random.uniform(poll_interval, wait * 3))
         except KeyboardInterrupt:
-            print("\n[WORKER] Shutting down...")
+            logger.info("[WORKER] Shutting down...")
             break
         except Exception as e:
-            print(f"[WORKER] Error: {e}")
-            time.sleep(poll_interval)
+            logger.error("[WORKER] Error: %s", e)
+            if listen_conn is not None and listen_conn.closed:
+                listen_conn = _open_listen_conn()
+            time.sleep(wait)
+            wait = min(MAX_POLL_INTERVAL, wait * 2)
 
 
 if __name__ == "__main__":